@@ -0,0 +1,24 @@
+"""Shared knobs and helpers for the CRUD vs SQLAlchemy benchmark modules."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+BATCH_SIZE = 50
+PAGE_SIZE = 20
+DEEP_PAGE = 1000
+PROFILES_PER_USER = 10
+COPY_BATCH_SIZE = 5000
+WARMUP_CALLS = int(os.getenv("BENCH_WARMUP", "50"))
+
+
+def warm(run: Callable[[], None]) -> Callable[[], None]:
+    """Call ``run`` ``WARMUP_CALLS`` times untimed and return it.
+
+    The first calls pay statement compilation, pool checkout and page-cache
+    fills; paying them here keeps those outliers out of the measured rounds.
+    """
+    for _ in range(WARMUP_CALLS):
+        run()
+    return run
@@ -1,32 +1,100 @@
 from __future__ import annotations
 
+import logging
 import os
 import pathlib
 import sys
 from collections.abc import Callable, Generator
-from itertools import count
+from itertools import cycle
+from typing import Any
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import Column, String, create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+    create_engine,
+    event,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.orm import (
+    Session,
+    SessionTransaction,
+    declarative_base,
+    relationship,
+    sessionmaker,
+)
+from sqlalchemy.pool import StaticPool
 
 ROOT_DIR = pathlib.Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT_DIR / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
+from bench_common import PROFILES_PER_USER
 from sqlalchemy_crud_tx import CRUD
 
 Base = declarative_base()
 
+EMAIL_POOL_SIZE = 50_000
+PAGE_ROWS = 50_000
+PROFILE_USERS = 100
+QUERY_CACHE_SIZE = 1200
+SEED_USERS = 200
+
+_LOG = logging.getLogger("bench")
+# Per-xdist-worker table suffix so parallel workers on a shared BENCH_DB
+# never touch each other's rows.
+_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+_TABLE_SUFFIX = f"_{_WORKER}" if _WORKER else ""
+
 
 class BenchUser(Base):  # type: ignore[misc]
-    __tablename__ = "bench_user"
+    __tablename__ = f"bench_user{_TABLE_SUFFIX}"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    email = Column(String(255), unique=True, nullable=False)
+    # passive_deletes keeps delete benchmarks from lazy-loading profiles.
+    profiles = relationship(
+        "BenchUserProfile", lazy="select", passive_deletes=True
+    )
+
+
+class BenchUserUUID(Base):  # type: ignore[misc]
+    """Same shape as ``BenchUser`` with a client-generated ``String(36)`` PK."""
+
+    __tablename__ = f"bench_user_uuid{_TABLE_SUFFIX}"
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     email = Column(String(255), unique=True, nullable=False)
 
 
+class BenchUserProfile(Base):  # type: ignore[misc]
+    __tablename__ = f"bench_user_profile{_TABLE_SUFFIX}"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer,
+        ForeignKey(f"bench_user{_TABLE_SUFFIX}.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    label = Column(String(64), nullable=False)
+
+
+class BenchPageRow(Base):  # type: ignore[misc]
+    """Large, read-only table used by deep pagination benchmarks."""
+
+    __tablename__ = f"bench_page_row{_TABLE_SUFFIX}"
+    id = Column(Integer, primary_key=True)
+    email = Column(String(255), unique=True, nullable=False)
+
+
+BenchModel = type[BenchUser] | type[BenchUserUUID]
+
+
 def _load_bench_db_uri() -> str:
     uri = os.getenv("BENCH_DB", "sqlite+pysqlite:///:memory:")
     if uri.startswith("mysql://"):
@@ -34,13 +102,64 @@ def _load_bench_db_uri() -> str:
     return uri
 
 
+def _clear_bench_tables(session: Session) -> None:
+    """Empty benchmark tables with Core DML, bypassing ORM synchronization."""
+    tables = (
+        BenchUserProfile.__table__,
+        BenchUser.__table__,
+        BenchUserUUID.__table__,
+    )
+    if session.get_bind().dialect.name == "mysql":
+        session.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+        for table in tables:
+            session.execute(text(f"TRUNCATE TABLE {table.name}"))
+        session.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+    else:
+        for table in tables:
+            session.execute(table.delete())
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "readonly: benchmark never commits, so sa_session skips clearing tables",
+    )
+
+
 @pytest.fixture(scope="session")
 def bench_engine():
-    engine = create_engine(_load_bench_db_uri(), echo=False, future=True)
+    uri = _load_bench_db_uri()
+    engine_kwargs: dict[str, Any] = {
+        "echo": False,
+        "future": True,
+        "query_cache_size": QUERY_CACHE_SIZE,
+    }
+    if ":memory:" in uri:
+        # Share one connection so every session sees the same hot in-memory DB.
+        engine_kwargs["poolclass"] = StaticPool
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    engine = create_engine(uri, **engine_kwargs)
+    cache_stats = {"hit": 0, "total": 0}
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _count_cache_hits(conn, cursor, statement, params, context, executemany):
+        cache_stats["total"] += 1
+        if context is not None and context.cache_hit is CACHE_HIT:
+            cache_stats["hit"] += 1
+
     Base.metadata.create_all(engine)
     try:
         yield engine
     finally:
+        total = cache_stats["total"]
+        if total:
+            _LOG.info(
+                "compiled cache hit ratio: %.2f%% (%d/%d); pool: %s",
+                100.0 * cache_stats["hit"] / total,
+                cache_stats["hit"],
+                total,
+                engine.pool.status(),
+            )
         Base.metadata.drop_all(engine)
         engine.dispose()
 
@@ -51,22 +170,49 @@ def SessionLocal(bench_engine) -> sessionmaker[Session]:
         bind=bench_engine,
         class_=Session,
         expire_on_commit=False,
-        autoflush=True,
+        # Mutation cases flush explicitly; reads skip the autoflush scan.
+        autoflush=False,
     )
 
 
+@pytest.fixture(scope="module")
+def bench_seed_state() -> dict[str, list[Any]]:
+    """Per-table snapshot of the ``seeded_many_users`` ids while still intact.
+
+    A missing entry means the tables were cleared or reseeded by something
+    else and the snapshot must be rebuilt.
+    """
+    return {}
+
+
 @pytest.fixture(scope="function")
-def sa_session(SessionLocal: sessionmaker[Session]) -> Generator[Session, None, None]:
+def sa_session(
+    request: pytest.FixtureRequest,
+    SessionLocal: sessionmaker[Session],
+    bench_seed_state: dict[str, list[Any]],
+) -> Generator[Session, None, None]:
     session = SessionLocal()
     try:
-        session.query(BenchUser).delete()
-        session.commit()
+        if request.node.get_closest_marker("readonly") is None:
+            _clear_bench_tables(session)
+            session.commit()
+            bench_seed_state.clear()
         yield session
     finally:
         session.rollback()
         session.close()
 
 
+@pytest.fixture(scope="function")
+def sa_savepoint(sa_session: Session) -> Callable[[], SessionTransaction]:
+    """Return a SAVEPOINT factory for mutation benchmarks on ``sa_session``.
+
+    Rolling back a SAVEPOINT keeps the outer transaction and identity map
+    alive, so iterations avoid a full BEGIN/ROLLBACK round trip.
+    """
+    return sa_session.begin_nested
+
+
 @pytest.fixture(scope="function")
 def configured_crud(sa_session: Session) -> None:
     CRUD.configure(
@@ -76,48 +222,146 @@ def configured_crud(sa_session: Session) -> None:
     )
 
 
+@pytest.fixture(scope="session")
+def email_pool() -> dict[str, list[str]]:
+    """Lazily materialized per-prefix email lists shared by all benchmarks."""
+    return {}
+
+
 @pytest.fixture(scope="function")
-def email_factory() -> Callable[[str], str]:
-    seq = count()
+def email_factory(
+    email_pool: dict[str, list[str]],
+) -> Callable[[str], Callable[[], str]]:
+    """Return a ``prefix -> next_email`` factory backed by a precomputed pool.
+
+    Emails are built once per prefix so the measured ``run()`` closures only
+    pay a C-level iterator step instead of string formatting per call.
+    """
 
-    def _new(prefix: str) -> str:
-        return f"{prefix}-{next(seq)}@bench.local"
+    def _for(prefix: str) -> Callable[[], str]:
+        pool = email_pool.get(prefix)
+        if pool is None:
+            pool = [f"{prefix}-{i}@bench.local" for i in range(EMAIL_POOL_SIZE)]
+            email_pool[prefix] = pool
+        return cycle(pool).__next__
 
-    return _new
+    return _for
 
 
 @pytest.fixture(scope="function")
 def seeded_user(
     sa_session: Session,
-    email_factory: Callable[[str], str],
-) -> tuple[str, str]:
-    user = BenchUser(email=email_factory("seed"))
+    bench_seed_state: dict[str, list[Any]],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model: BenchModel,
+) -> tuple[Any, str]:
+    _clear_bench_tables(sa_session)
+    bench_seed_state.clear()
+    user = bench_user_model(email=email_factory("seed")())
     sa_session.add(user)
     sa_session.commit()
     return user.id, user.email
 
 
 @pytest.fixture(scope="function")
-def seeded_user_id(seeded_user: tuple[str, str]) -> str:
+def seeded_user_id(seeded_user: tuple[Any, str]) -> Any:
     return seeded_user[0]
 
 
 @pytest.fixture(scope="function")
-def seeded_user_email(seeded_user: tuple[str, str]) -> str:
+def seeded_user_email(seeded_user: tuple[Any, str]) -> str:
     return seeded_user[1]
 
 
 @pytest.fixture(scope="function")
 def seeded_many_users(
     sa_session: Session,
-    email_factory: Callable[[str], str],
-) -> list[str]:
-    rows = [BenchUser(email=email_factory("seed-many")) for _ in range(200)]
-    sa_session.add_all(rows)
+    bench_seed_state: dict[str, list[Any]],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model: BenchModel,
+) -> list[Any]:
+    """Return ``SEED_USERS`` committed user ids, reseeding only when dirty."""
+    table = bench_user_model.__table__
+    user_ids = bench_seed_state.get(table.name)
+    if user_ids is not None:
+        return user_ids
+
+    next_email = email_factory("seed-many")
+    rows: list[dict[str, Any]] = [{"email": next_email()} for _ in range(SEED_USERS)]
+    if bench_user_model is BenchUserUUID:
+        for row in rows:
+            row["id"] = str(uuid4())
+    _clear_bench_tables(sa_session)
+    bench_seed_state.clear()
+    if sa_session.get_bind().dialect.insert_executemany_returning:
+        # One insertmanyvalues batch hands the generated ids straight back.
+        stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        user_ids = list(sa_session.scalars(stmt, rows))
+    else:
+        sa_session.execute(insert(table), rows)
+        user_ids = list(sa_session.scalars(select(table.c.id).order_by(table.c.id)))
     sa_session.commit()
-    return [row.id for row in rows]
+    bench_seed_state[table.name] = user_ids
+    return user_ids
+
+
+@pytest.fixture(scope="function")
+def seeded_users_with_profiles(
+    sa_session: Session,
+    bench_seed_state: dict[str, list[Any]],
+    bench_user_model: BenchModel,
+) -> int:
+    """Seed users that each own ``PROFILES_PER_USER`` profiles; return user count."""
+    if bench_user_model is not BenchUser:
+        pytest.skip("Profiles are only mapped on the integer-PK BenchUser.")
+    _clear_bench_tables(sa_session)
+    bench_seed_state.clear()
+    sa_session.execute(
+        insert(BenchUser),
+        [
+            {"email": f"profile-owner-{idx}@bench.local"}
+            for idx in range(PROFILE_USERS)
+        ],
+    )
+    user_ids = sa_session.scalars(select(BenchUser.id)).all()
+    sa_session.execute(
+        insert(BenchUserProfile),
+        [
+            {"user_id": user_id, "label": f"profile-{n}"}
+            for user_id in user_ids
+            for n in range(PROFILES_PER_USER)
+        ],
+    )
+    sa_session.commit()
+    return PROFILE_USERS
+
+
+@pytest.fixture(
+    scope="session",
+    params=[BenchUser, BenchUserUUID],
+    ids=["intpk", "uuidpk"],
+)
+def bench_user_model(request: pytest.FixtureRequest) -> BenchModel:
+    """User model under test: integer autoincrement PK or client-side UUID text PK."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def bench_page_rows(SessionLocal: sessionmaker[Session]) -> int:
+    """Seed ``bench_page_row`` once per session and return its row count."""
+    session = SessionLocal()
+    try:
+        session.execute(BenchPageRow.__table__.delete())
+        session.execute(
+            insert(BenchPageRow),
+            [{"email": f"page-{i:06d}@bench.local"} for i in range(PAGE_ROWS)],
+        )
+        session.commit()
+    finally:
+        session.close()
+    return PAGE_ROWS
 
 
 @pytest.fixture(scope="session")
-def bench_user_model() -> type[BenchUser]:
-    return BenchUser
+def bench_page_model() -> type[BenchPageRow]:
+    return BenchPageRow
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy.orm import Session, SessionTransaction
+
+pytest.importorskip("pytest_benchmark")
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+pytestmark = pytest.mark.skipif(
+    not RUN_BENCHMARKS,
+    reason="Set RUN_BENCHMARKS=1 to run benchmark cases.",
+)
+
+from bench_common import warm
+from sqlalchemy_crud_tx import CRUD
+
+
+@pytest.mark.benchmark(group="add_flush")
+def test_sa_add_flush(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("sa-add")
+
+    add = sa_session.add
+    flush = sa_session.flush
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        row = bench_user_model(email=next_email())
+        add(row)
+        flush()
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="add_flush")
+def test_crud_add_flush(
+    benchmark,
+    configured_crud: None,
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("crud-add")
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            row = crud.add(email=next_email())
+            if row is None:
+                raise RuntimeError("CRUD add returned None")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="add_instance_flush")
+def test_sa_add_instance_flush(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("sa-add-inst")
+
+    add = sa_session.add
+    flush = sa_session.flush
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        row = bench_user_model(email=next_email())
+        add(row)
+        flush()
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="add_instance_flush")
+def test_crud_add_instance_flush(
+    benchmark,
+    configured_crud: None,
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("crud-add-inst")
+
+    def run() -> None:
+        row = bench_user_model(email=next_email())
+        with CRUD(bench_user_model) as crud:
+            inserted = crud.add(instance=row)
+            if inserted is None:
+                raise RuntimeError("CRUD add(instance=...) returned None")
+            crud.discard()
+
+    benchmark(warm(run))
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Callable
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import String, insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+pytest.importorskip("pytest_benchmark")
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+pytestmark = pytest.mark.skipif(
+    not RUN_BENCHMARKS,
+    reason="Set RUN_BENCHMARKS=1 to run benchmark cases.",
+)
+
+from bench_common import BATCH_SIZE, COPY_BATCH_SIZE, warm
+from sqlalchemy_crud_tx import CRUD
+
+
+@pytest.mark.benchmark(group="add_many_flush")
+def test_sa_add_many_flush(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("sa-bulk")
+
+    add_all = sa_session.add_all
+    flush = sa_session.flush
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        rows = [bench_user_model(email=next_email()) for _ in range(BATCH_SIZE)]
+        add_all(rows)
+        flush()
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="add_many_flush")
+def test_crud_add_many_flush(
+    benchmark,
+    configured_crud: None,
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("crud-bulk")
+
+    def run() -> None:
+        rows = [
+            bench_user_model(email=next_email())
+            for _ in range(BATCH_SIZE)
+        ]
+        with CRUD(bench_user_model) as crud:
+            inserted = crud.add_many(rows)
+            if inserted is None:
+                raise RuntimeError("CRUD add_many returned None")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="add_many_core")
+def test_sa_add_many_core(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("sa-bulk-core")
+
+    execute = sa_session.execute
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        rows = [{"email": next_email()} for _ in range(BATCH_SIZE)]
+        execute(insert(bench_user_model), rows)
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="add_many_core")
+def test_crud_add_many_core(
+    benchmark,
+    configured_crud: None,
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("crud-bulk-core")
+
+    def run() -> None:
+        rows = [{"email": next_email()} for _ in range(BATCH_SIZE)]
+        with CRUD(bench_user_model) as crud:
+            inserted = crud.bulk_insert(rows)
+            if inserted != BATCH_SIZE:
+                raise RuntimeError("CRUD bulk_insert returned unexpected count")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="add_many_mappings")
+def test_sa_add_many_mappings(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("sa-bulk-mappings")
+
+    bulk_insert_mappings = sa_session.bulk_insert_mappings
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        rows = [{"email": next_email()} for _ in range(BATCH_SIZE)]
+        bulk_insert_mappings(bench_user_model, rows)
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+def _require_postgresql(engine) -> None:
+    if engine.dialect.name != "postgresql":
+        pytest.skip("COPY benchmarks require a PostgreSQL BENCH_DB.")
+
+
+def _has_client_pk(model) -> bool:
+    """Whether ``model`` needs its (UUID text) primary key supplied on insert."""
+    return isinstance(model.__table__.c.id.type, String)
+
+
+def _copy_rows(
+    session: Session, table_name: str, columns: tuple[str, ...], rows: list[tuple]
+) -> None:
+    """Stream ``rows`` into ``table_name`` with ``COPY ... FROM STDIN``."""
+    payload = "".join("\t".join(map(str, row)) + "\n" for row in rows)
+    statement = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+    dbapi_conn = session.connection().connection.driver_connection
+    with dbapi_conn.cursor() as cursor:
+        if hasattr(cursor, "copy_expert"):  # psycopg2
+            cursor.copy_expert(statement, io.StringIO(payload))
+        else:  # psycopg 3
+            with cursor.copy(statement) as copy:
+                copy.write(payload)
+
+
+@pytest.mark.benchmark(group="add_many_copy")
+def test_sa_add_many_copy(
+    benchmark,
+    bench_engine,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    _require_postgresql(bench_engine)
+    next_email = email_factory("sa-copy")
+    table_name = bench_user_model.__tablename__
+    client_pk = _has_client_pk(bench_user_model)
+    columns = ("id", "email") if client_pk else ("email",)
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        if client_pk:
+            rows = [(str(uuid4()), next_email()) for _ in range(COPY_BATCH_SIZE)]
+        else:
+            rows = [(next_email(),) for _ in range(COPY_BATCH_SIZE)]
+        _copy_rows(sa_session, table_name, columns, rows)
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="add_many_copy")
+def test_crud_add_many_copy_baseline(
+    benchmark,
+    bench_engine,
+    configured_crud: None,
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    _require_postgresql(bench_engine)
+    next_email = email_factory("crud-copy")
+    client_pk = _has_client_pk(bench_user_model)
+
+    def run() -> None:
+        rows = [{"email": next_email()} for _ in range(COPY_BATCH_SIZE)]
+        if client_pk:
+            for row in rows:
+                row["id"] = str(uuid4())
+        with CRUD(bench_user_model) as crud:
+            if crud.bulk_insert(rows) != COPY_BATCH_SIZE:
+                raise RuntimeError("CRUD bulk_insert returned unexpected count")
+            crud.discard()
+
+    benchmark(warm(run))
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import Session, SessionTransaction
+
+pytest.importorskip("pytest_benchmark")
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+pytestmark = pytest.mark.skipif(
+    not RUN_BENCHMARKS,
+    reason="Set RUN_BENCHMARKS=1 to run benchmark cases.",
+)
+
+from bench_common import warm
+from sqlalchemy_crud_tx import CRUD
+
+
+@pytest.mark.benchmark(group="delete_flush")
+def test_sa_delete_flush(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    seeded_user_id: Any,
+    bench_user_model,
+):
+    query = sa_session.query
+    delete = sa_session.delete
+    flush = sa_session.flush
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        row = query(bench_user_model).filter_by(id=seeded_user_id).first()
+        if row is None:
+            raise RuntimeError("Seed row missing")
+        delete(row)
+        flush()
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="delete_flush")
+def test_crud_delete_flush(
+    benchmark,
+    configured_crud: None,
+    seeded_user_id: Any,
+    bench_user_model,
+):
+    def run() -> None:
+        with CRUD(bench_user_model, id=seeded_user_id) as crud:
+            ok = crud.delete()
+            if not ok:
+                raise RuntimeError("CRUD delete returned False")
+            # Keep SQL effects comparable to SA baseline (explicit DELETE flush).
+            crud.session.flush()
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="delete_by_instance_flush")
+def test_sa_delete_by_instance_flush(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    if not seeded_many_users:
+        raise RuntimeError("Seed dataset missing")
+
+    query = sa_session.query
+    delete = sa_session.delete
+    flush = sa_session.flush
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        row = query(bench_user_model).first()
+        if row is None:
+            raise RuntimeError("Seed row missing")
+        delete(row)
+        flush()
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="delete_by_instance_flush")
+def test_crud_delete_by_instance_flush(
+    benchmark,
+    configured_crud: None,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    if not seeded_many_users:
+        raise RuntimeError("Seed dataset missing")
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            row = crud.first()
+            if row is None:
+                raise RuntimeError("Seed row missing")
+            ok = crud.delete(instance=row)
+            if not ok:
+                raise RuntimeError("CRUD delete(instance=...) returned False")
+            crud.session.flush()
+            crud.discard()
+
+    benchmark(warm(run))
@@ -0,0 +1,561 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+
+pytest.importorskip("pytest_benchmark")
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+pytestmark = pytest.mark.skipif(
+    not RUN_BENCHMARKS,
+    reason="Set RUN_BENCHMARKS=1 to run benchmark cases.",
+)
+
+from bench_common import DEEP_PAGE, PAGE_SIZE, PROFILES_PER_USER, warm
+from sqlalchemy_crud_tx import CRUD
+from sqlalchemy_crud_tx.pagination import paginate_query
+
+
+@pytest.mark.benchmark(group="get_by_pk")
+@pytest.mark.readonly
+def test_sa_get_by_pk(
+    benchmark,
+    sa_session: Session,
+    seeded_user_id: Any,
+    bench_user_model,
+):
+    get = sa_session.get
+
+    def run() -> None:
+        row = get(bench_user_model, seeded_user_id)
+        if row is None:
+            raise RuntimeError("Seed row missing")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="get_by_pk")
+@pytest.mark.readonly
+def test_crud_get_by_pk(
+    benchmark,
+    configured_crud: None,
+    seeded_user_id: Any,
+    bench_user_model,
+):
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            row = crud.get(seeded_user_id)
+            if row is None:
+                raise RuntimeError("Seed row missing")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="get_by_email")
+@pytest.mark.readonly
+def test_sa_get_by_email(
+    benchmark,
+    sa_session: Session,
+    seeded_user_email: str,
+    bench_user_model,
+):
+    query = sa_session.query
+
+    def run() -> None:
+        row = query(bench_user_model).filter_by(email=seeded_user_email).first()
+        if row is None:
+            raise RuntimeError("Seed row missing")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="get_by_email")
+@pytest.mark.readonly
+def test_crud_get_by_email(
+    benchmark,
+    configured_crud: None,
+    seeded_user_email: str,
+    bench_user_model,
+):
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            row = crud.query(email=seeded_user_email).first()
+            if row is None:
+                raise RuntimeError("Seed row missing")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="get_by_email")
+@pytest.mark.readonly
+def test_crud_get_by_email_default_filter(
+    benchmark,
+    configured_crud: None,
+    seeded_user_email: str,
+    bench_user_model,
+):
+    def run() -> None:
+        # Keyword defaults + first() take the cached-plan path.
+        with CRUD(bench_user_model, email=seeded_user_email) as crud:
+            row = crud.first()
+            if row is None:
+                raise RuntimeError("Seed row missing")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="count_rows")
+@pytest.mark.readonly
+def test_sa_count_rows(
+    benchmark,
+    sa_session: Session,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+
+    query = sa_session.query
+
+    def run() -> None:
+        total = query(bench_user_model).count()
+        if total != expected:
+            raise RuntimeError(f"Expected {expected} rows, got {total}")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="count_rows")
+@pytest.mark.readonly
+def test_sa_count_rows_core(
+    benchmark,
+    sa_session: Session,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+
+    scalar = sa_session.scalar
+
+    def run() -> None:
+        total = scalar(select(func.count()).select_from(bench_user_model))
+        if total != expected:
+            raise RuntimeError(f"Expected {expected} rows, got {total}")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="count_rows")
+@pytest.mark.readonly
+def test_crud_count_rows(
+    benchmark,
+    configured_crud: None,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            total = crud.query().count()
+            if total != expected:
+                raise RuntimeError(f"Expected {expected} rows, got {total}")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="all_rows")
+@pytest.mark.readonly
+def test_sa_all_rows(
+    benchmark,
+    sa_session: Session,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+
+    query = sa_session.query
+
+    def run() -> None:
+        rows = query(bench_user_model).all()
+        if len(rows) != expected:
+            raise RuntimeError(f"Expected {expected} rows, got {len(rows)}")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="all_rows")
+@pytest.mark.readonly
+def test_sa_all_rows_stream(
+    benchmark,
+    sa_session: Session,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+
+    scalars = sa_session.scalars
+
+    def run() -> None:
+        total = 0
+        for _ in scalars(
+            select(bench_user_model).execution_options(yield_per=100)
+        ):
+            total += 1
+        if total != expected:
+            raise RuntimeError(f"Expected {expected} rows, got {total}")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="all_rows")
+@pytest.mark.readonly
+def test_sa_all_rows_core_tuple(
+    benchmark,
+    sa_session: Session,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+
+    execute = sa_session.execute
+
+    def run() -> None:
+        rows = execute(select(bench_user_model.id, bench_user_model.email)).all()
+        if len(rows) != expected:
+            raise RuntimeError(f"Expected {expected} rows, got {len(rows)}")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="all_rows")
+@pytest.mark.readonly
+def test_crud_all_rows(
+    benchmark,
+    configured_crud: None,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            rows = crud.query().all()
+            if len(rows) != expected:
+                raise RuntimeError(f"Expected {expected} rows, got {len(rows)}")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="all_rows")
+@pytest.mark.readonly
+def test_crud_all_rows_columns(
+    benchmark,
+    configured_crud: None,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            rows = crud.query().columns(bench_user_model.id, bench_user_model.email)
+            if len(rows) != expected:
+                raise RuntimeError(f"Expected {expected} rows, got {len(rows)}")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="paginate_page1")
+@pytest.mark.readonly
+def test_sa_paginate_page1(
+    benchmark,
+    sa_session: Session,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+    expected_first_page = min(expected, PAGE_SIZE)
+
+    query = sa_session.query
+
+    def run() -> None:
+        ordered = query(bench_user_model).order_by(bench_user_model.email)
+        page = paginate_query(
+            ordered,
+            page=1,
+            per_page=PAGE_SIZE,
+            count=True,
+        )
+        if len(page.items) != expected_first_page:
+            raise RuntimeError("Unexpected page size")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="paginate_page1")
+@pytest.mark.readonly
+def test_crud_paginate_page1(
+    benchmark,
+    configured_crud: None,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    expected = len(seeded_many_users)
+    expected_first_page = min(expected, PAGE_SIZE)
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            page = crud.query().order_by(bench_user_model.email).paginate(
+                page=1,
+                per_page=PAGE_SIZE,
+                count=True,
+            )
+            if len(page.items) != expected_first_page:
+                raise RuntimeError("Unexpected page size")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+def _deep_page_cursor(session: Session, model) -> str:
+    """Return the keyset cursor that starts ``DEEP_PAGE`` (last email before it)."""
+    return (
+        session.query(model.email)
+        .order_by(model.email)
+        .offset((DEEP_PAGE - 1) * PAGE_SIZE - 1)
+        .limit(1)
+        .scalar()
+    )
+
+
+@pytest.mark.benchmark(group="paginate_pageN")
+@pytest.mark.readonly
+def test_sa_paginate_pageN_offset(
+    benchmark,
+    sa_session: Session,
+    bench_page_rows: int,
+    bench_page_model,
+):
+    query = sa_session.query
+
+    def run() -> None:
+        ordered = query(bench_page_model).order_by(bench_page_model.email)
+        page = paginate_query(ordered, page=DEEP_PAGE, per_page=PAGE_SIZE, count=False)
+        if len(page.items) != PAGE_SIZE:
+            raise RuntimeError("Unexpected page size")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="paginate_pageN")
+@pytest.mark.readonly
+def test_sa_paginate_pageN_keyset(
+    benchmark,
+    sa_session: Session,
+    bench_page_rows: int,
+    bench_page_model,
+):
+    cursor = _deep_page_cursor(sa_session, bench_page_model)
+
+    query = sa_session.query
+
+    def run() -> None:
+        rows = (
+            query(bench_page_model)
+            .filter(bench_page_model.email > cursor)
+            .order_by(bench_page_model.email)
+            .limit(PAGE_SIZE)
+            .all()
+        )
+        if len(rows) != PAGE_SIZE:
+            raise RuntimeError("Unexpected page size")
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="paginate_pageN")
+@pytest.mark.readonly
+def test_crud_paginate_pageN_offset(
+    benchmark,
+    configured_crud: None,
+    bench_page_rows: int,
+    bench_page_model,
+):
+    def run() -> None:
+        with CRUD(bench_page_model) as crud:
+            page = crud.query().order_by(bench_page_model.email).paginate(
+                page=DEEP_PAGE,
+                per_page=PAGE_SIZE,
+                count=False,
+            )
+            if len(page.items) != PAGE_SIZE:
+                raise RuntimeError("Unexpected page size")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="paginate_pageN")
+@pytest.mark.readonly
+def test_crud_paginate_pageN_keyset(
+    benchmark,
+    configured_crud: None,
+    sa_session: Session,
+    bench_page_rows: int,
+    bench_page_model,
+):
+    cursor = _deep_page_cursor(sa_session, bench_page_model)
+    sa_session.rollback()
+
+    def run() -> None:
+        with CRUD(bench_page_model) as crud:
+            page = crud.query().paginate_keyset(
+                bench_page_model.email,
+                cursor=cursor,
+                per_page=PAGE_SIZE,
+            )
+            if len(page.items) != PAGE_SIZE:
+                raise RuntimeError("Unexpected page size")
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+def _count_profiles(users) -> int:
+    return sum(len(user.profiles) for user in users)
+
+
+@pytest.mark.benchmark(group="load_relationships")
+@pytest.mark.readonly
+def test_sa_list_with_profiles_lazy(
+    benchmark,
+    sa_session: Session,
+    seeded_users_with_profiles: int,
+    bench_user_model,
+):
+    expected = seeded_users_with_profiles * PROFILES_PER_USER
+
+    query = sa_session.query
+    expunge_all = sa_session.expunge_all
+
+    def run() -> None:
+        users = query(bench_user_model).all()
+        if _count_profiles(users) != expected:
+            raise RuntimeError("Unexpected profile count")
+        # Drop loaded collections so every iteration pays the N+1 loads again.
+        expunge_all()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="load_relationships")
+@pytest.mark.readonly
+def test_sa_list_with_profiles_selectin(
+    benchmark,
+    sa_session: Session,
+    seeded_users_with_profiles: int,
+    bench_user_model,
+):
+    expected = seeded_users_with_profiles * PROFILES_PER_USER
+
+    query = sa_session.query
+    expunge_all = sa_session.expunge_all
+
+    def run() -> None:
+        users = (
+            query(bench_user_model)
+            .options(selectinload(bench_user_model.profiles))
+            .all()
+        )
+        if _count_profiles(users) != expected:
+            raise RuntimeError("Unexpected profile count")
+        expunge_all()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="load_relationships")
+@pytest.mark.readonly
+def test_sa_list_with_profiles_joined(
+    benchmark,
+    sa_session: Session,
+    seeded_users_with_profiles: int,
+    bench_user_model,
+):
+    expected = seeded_users_with_profiles * PROFILES_PER_USER
+
+    query = sa_session.query
+    expunge_all = sa_session.expunge_all
+
+    def run() -> None:
+        users = (
+            query(bench_user_model)
+            .options(joinedload(bench_user_model.profiles))
+            .all()
+        )
+        if _count_profiles(users) != expected:
+            raise RuntimeError("Unexpected profile count")
+        expunge_all()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="load_relationships")
+@pytest.mark.readonly
+def test_sa_list_with_profiles_selectin_raiseload(
+    benchmark,
+    sa_session: Session,
+    seeded_users_with_profiles: int,
+    bench_user_model,
+):
+    expected = seeded_users_with_profiles * PROFILES_PER_USER
+
+    query = sa_session.query
+    expunge_all = sa_session.expunge_all
+
+    def run() -> None:
+        # raiseload("*") fails fast if any relationship would still lazy-load.
+        users = (
+            query(bench_user_model)
+            .options(selectinload(bench_user_model.profiles), raiseload("*"))
+            .all()
+        )
+        if _count_profiles(users) != expected:
+            raise RuntimeError("Unexpected profile count")
+        expunge_all()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="load_relationships")
+@pytest.mark.readonly
+def test_crud_list_with_profiles_selectin(
+    benchmark,
+    configured_crud: None,
+    seeded_users_with_profiles: int,
+    bench_user_model,
+):
+    expected = seeded_users_with_profiles * PROFILES_PER_USER
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            users = (
+                crud.query()
+                .options(selectinload(bench_user_model.profiles), raiseload("*"))
+                .all()
+            )
+            if _count_profiles(users) != expected:
+                raise RuntimeError("Unexpected profile count")
+            crud.discard()
+            crud.session.expunge_all()
+
+    benchmark(warm(run))
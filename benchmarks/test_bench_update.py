@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session, SessionTransaction
+
+pytest.importorskip("pytest_benchmark")
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+pytestmark = pytest.mark.skipif(
+    not RUN_BENCHMARKS,
+    reason="Set RUN_BENCHMARKS=1 to run benchmark cases.",
+)
+
+from bench_common import BATCH_SIZE, warm
+from sqlalchemy_crud_tx import CRUD
+
+
+@pytest.mark.benchmark(group="update_flush")
+def test_sa_update_flush(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    seeded_user_id: Any,
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("sa-update")
+
+    query = sa_session.query
+    flush = sa_session.flush
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        row = query(bench_user_model).filter_by(id=seeded_user_id).first()
+        if row is None:
+            raise RuntimeError("Seed row missing")
+        row.email = next_email()
+        flush()
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="update_flush")
+def test_crud_update_flush(
+    benchmark,
+    configured_crud: None,
+    seeded_user_id: Any,
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    next_email = email_factory("crud-update")
+
+    def run() -> None:
+        with CRUD(bench_user_model, id=seeded_user_id) as crud:
+            row = crud.first()
+            if row is None:
+                raise RuntimeError("Seed row missing")
+            updated = crud.update(row, email=next_email())
+            if updated is None:
+                raise RuntimeError("CRUD update returned None")
+            # Keep SQL effects comparable to SA baseline (explicit UPDATE flush).
+            crud.session.flush()
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="update_first_flush")
+def test_sa_update_first_flush(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    seeded_many_users: list[Any],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    if not seeded_many_users:
+        raise RuntimeError("Seed dataset missing")
+
+    next_email = email_factory("sa-update-first")
+
+    query = sa_session.query
+    flush = sa_session.flush
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        row = query(bench_user_model).first()
+        if row is None:
+            raise RuntimeError("Seed row missing")
+        row.email = next_email()
+        flush()
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="update_first_flush")
+def test_crud_update_first_flush(
+    benchmark,
+    configured_crud: None,
+    seeded_many_users: list[Any],
+    email_factory: Callable[[str], Callable[[], str]],
+    bench_user_model,
+):
+    if not seeded_many_users:
+        raise RuntimeError("Seed dataset missing")
+
+    next_email = email_factory("crud-update-first")
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            updated = crud.update(email=next_email())
+            if updated is None:
+                raise RuntimeError("CRUD update(instance=None) returned None")
+            crud.session.flush()
+            crud.discard()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="bulk_update")
+def test_sa_bulk_update_uow(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    ids = seeded_many_users[:BATCH_SIZE]
+
+    query = sa_session.query
+    flush = sa_session.flush
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        rows = (
+            query(bench_user_model)
+            .filter(bench_user_model.id.in_(ids))
+            .all()
+        )
+        for row in rows:
+            row.email = row.email + "-u"
+        flush()
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="bulk_update")
+def test_sa_bulk_update_core(
+    benchmark,
+    sa_session: Session,
+    sa_savepoint: Callable[[], SessionTransaction],
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    ids = seeded_many_users[:BATCH_SIZE]
+
+    execute = sa_session.execute
+
+    def run() -> None:
+        savepoint = sa_savepoint()
+        execute(
+            update(bench_user_model)
+            .where(bench_user_model.id.in_(ids))
+            .values(email=bench_user_model.email + "-u"),
+            execution_options={"synchronize_session": False},
+        )
+        savepoint.rollback()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="bulk_update")
+def test_crud_bulk_update_core(
+    benchmark,
+    configured_crud: None,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    ids = seeded_many_users[:BATCH_SIZE]
+
+    def run() -> None:
+        with CRUD(bench_user_model) as crud:
+            updated = crud.update_many(
+                crud.query(bench_user_model.id.in_(ids)),
+                sync=False,
+                email=bench_user_model.email + "-u",
+            )
+            if updated != BATCH_SIZE:
+                raise RuntimeError("CRUD update_many returned unexpected count")
+            crud.discard()
+
+    benchmark(warm(run))
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+pytest.importorskip("pytest_benchmark")
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+pytestmark = pytest.mark.skipif(
+    not RUN_BENCHMARKS,
+    reason="Set RUN_BENCHMARKS=1 to run benchmark cases.",
+)
+
+from bench_common import warm
+
+CONCURRENCY = 32
+
+
+@pytest.fixture(scope="module")
+def bench_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    """One event loop per module; asyncpg connections are bound to their loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop
+    finally:
+        loop.close()
+
+
+@pytest.fixture(scope="module")
+def async_bench_engine(bench_engine, bench_loop: asyncio.AbstractEventLoop):
+    """``AsyncEngine`` on the same PostgreSQL database as ``bench_engine``."""
+    if bench_engine.dialect.name != "postgresql":
+        pytest.skip("Async benchmarks require a PostgreSQL BENCH_DB.")
+    pytest.importorskip("asyncpg")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(
+        bench_engine.url.set(drivername="postgresql+asyncpg"),
+        pool_size=CONCURRENCY,
+    )
+    try:
+        yield engine
+    finally:
+        bench_loop.run_until_complete(engine.dispose())
+
+
+@pytest.mark.benchmark(group="async_io")
+@pytest.mark.readonly
+def test_sync_select_by_pk_serial(
+    benchmark,
+    sa_session: Session,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    ids = seeded_many_users[:CONCURRENCY]
+    execute = sa_session.execute
+
+    def run() -> None:
+        for user_id in ids:
+            stmt = select(bench_user_model.email).where(bench_user_model.id == user_id)
+            execute(stmt).scalar_one()
+
+    benchmark(warm(run))
+
+
+@pytest.mark.benchmark(group="async_io")
+@pytest.mark.readonly
+def test_async_select_by_pk_gather(
+    benchmark,
+    bench_loop: asyncio.AbstractEventLoop,
+    async_bench_engine,
+    seeded_many_users: list[Any],
+    bench_user_model,
+):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    ids = seeded_many_users[:CONCURRENCY]
+
+    async def fetch(user_id: Any) -> None:
+        async with AsyncSession(async_bench_engine) as session:
+            stmt = select(bench_user_model.email).where(bench_user_model.id == user_id)
+            (await session.execute(stmt)).scalar_one()
+
+    async def fetch_all() -> None:
+        await asyncio.gather(*(fetch(user_id) for user_id in ids))
+
+    def run() -> None:
+        bench_loop.run_until_complete(fetch_all())
+
+    benchmark(warm(run))
@@ -1,11 +1,19 @@
 """Public entry points for the sqlalchemy_crud_tx package."""
 
-from .core import CRUD, CRUDQuery, ErrorLogger, PaginationResult, SQLStatus
+from .core import (
+    CRUD,
+    CRUDQuery,
+    ErrorLogger,
+    KeysetPaginationResult,
+    PaginationResult,
+    SQLStatus,
+)
 
 __all__ = [
     "CRUD",
     "CRUDQuery",
     "PaginationResult",
+    "KeysetPaginationResult",
     "SQLStatus",
     "ErrorLogger",
 ]
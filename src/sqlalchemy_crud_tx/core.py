@@ -7,7 +7,7 @@ type aliases so that callers can import from a single place.
 from __future__ import annotations
 
 from .crud import CRUD
-from .pagination import PaginationResult
+from .pagination import KeysetPaginationResult, PaginationResult
 from .query import CRUDQuery
 from .status import SQLStatus
 from .types import EntityTypeVar, ErrorLogger, ModelTypeVar, ResultTypeVar_co
@@ -16,6 +16,7 @@ __all__ = [
     "CRUD",
     "CRUDQuery",
     "PaginationResult",
+    "KeysetPaginationResult",
     "SQLStatus",
     "ErrorLogger",
     "ModelTypeVar",
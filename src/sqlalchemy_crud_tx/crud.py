@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import ExitStack, suppress
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,10 +18,19 @@ from typing import (
     cast,
 )
 
+from sqlalchemy import Select, bindparam, insert, select, update
 from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Query, SessionTransaction, object_session
-from sqlalchemy.sql import _orm_types
+from sqlalchemy.orm import (
+    Query,
+    Session,
+    SessionTransaction,
+    scoped_session,
+    sessionmaker,
+)
+from sqlalchemy.orm.attributes import set_attribute
+from sqlalchemy.pool import QueuePool
 
 from .query import CRUDQuery
 from .status import SQLStatus
@@ -27,18 +39,22 @@ from .transaction import (
     ExistingTxnPolicy,
     TransactionDecorator,
     _activate_txn_state,
+    _apply_existing_txn_policy,
     _begin_session,
-    _get_txn_origin_name,
+    _commit_session,
     _get_txn_state,
+    _has_unmarked_changes,
     _in_transaction,
-    _raise_existing_txn_error,
-    _reset_existing_txn,
+    _track_flushes,
     _TxnState,
     get_current_error_policy,
 )
 from .transaction import transaction as _txn_transaction
 from .types import ErrorLogger, ORMModel, QueryBuilder, SessionLike, SessionProvider
 
+if TYPE_CHECKING:
+    from sqlalchemy.sql import _orm_types
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
@@ -46,6 +62,7 @@ ModelTypeVar = TypeVar("ModelTypeVar", bound=ORMModel)
 ResultTypeVar_co = TypeVar("ResultTypeVar_co", covariant=True)
 
 _DEFAULT_LOGGER: ErrorLogger = logging.getLogger("CRUD").error
+_NO_PLAN = object()
 
 
 def _default_query_builder(
@@ -56,6 +73,23 @@ def _default_query_builder(
     return CRUDQuery(crud, cast(Query, sa_query))
 
 
+def _is_transient(instance: Any) -> bool:
+    """Return whether ``instance`` is a mapped object not yet bound to a Session."""
+    state = getattr(instance, "_sa_instance_state", None)
+    return state is not None and state.transient
+
+
+def _set_fields(
+    instance: Any, updates: Mapping[str, Any], column_keys: frozenset[str]
+) -> None:
+    """Assign ``updates``; mapped columns skip the descriptor via ``set_attribute``."""
+    for key, value in updates.items():
+        if key in column_keys:
+            set_attribute(instance, key, value)
+        else:
+            setattr(instance, key, value)
+
+
 class SessionProxy:
     """Session facade exposed to callers.
 
@@ -102,24 +136,55 @@ class CRUD(Generic[ModelTypeVar]):
     - Uses a context manager for commit / rollback.
     - Provides unified error state management via ``SQLStatus``.
     - Supports global and per-instance default filter conditions.
+    - Uses ``__slots__``; subclasses should declare their own ``__slots__``
+      (``()`` if they add no attributes) to avoid regaining a ``__dict__``.
     """
 
-    _global_filter_conditions: ClassVar[tuple[list, dict]] = ([], {})
+    __slots__ = (
+        "_model",
+        "_model_name",
+        "_kwargs",
+        "_instance_default_kwargs",
+        "error",
+        "status",
+        "_need_commit",
+        "_error_policy",
+        "_apply_global_filters",
+        "_txn_state",
+        "_joined_existing",
+        "_nested_txn",
+        "_explicit_committed",
+        "_discarded",
+        "_session",
+        "_base_query",
+        "_pending_rows",
+    )
+
+    _global_filter_conditions: ClassVar[
+        tuple[tuple[Any, ...], Mapping[str, Any]]
+    ] = ((), MappingProxyType({}))
     _session_provider: ClassVar[tuple[SessionProvider] | None] = None
     _query_builder: ClassVar[QueryBuilder | None] = None
     _default_error_policy: ClassVar[ErrorPolicy] = "raise"
     _existing_txn_policy: ClassVar[ExistingTxnPolicy] = "error"
     _logger: ClassVar[ErrorLogger] = _DEFAULT_LOGGER
+    _plan_cache: ClassVar[dict[tuple[Any, ...], Select]] = {}
+    _column_keys_cache: ClassVar[dict[type, frozenset[str]]] = {}
+    _txn_decorator_cache: ClassVar[dict[tuple[Any, ...], Any]] = {}
 
     @classmethod
     def register_global_filters(cls, *base_exprs, **base_kwargs) -> None:
         """Register global base filters applied to all models.
 
+        The filters are stored read-only on the class and shared by every
+        CRUD instance without copying; registering again replaces them for
+        all subsequent queries, including those of existing instances.
+
         Args:
             *base_exprs: Positional filter expressions passed to ``Query.filter``.
             **base_kwargs: Keyword-style filters passed to ``Query.filter_by``.
         """
-        cls._global_filter_conditions = (list(base_exprs) or []), (base_kwargs or {})
+        cls._global_filter_conditions = base_exprs, MappingProxyType(base_kwargs)
 
     def __init__(self, model: type[ModelTypeVar], **kwargs: Any) -> None:
         """Initialize a CRUD instance bound to a model.
@@ -130,11 +195,10 @@ class CRUD(Generic[ModelTypeVar]):
                 instance (used by ``query()`` and ``create_instance()``).
         """
         self._model = model
+        self._model_name: str = getattr(model, "__name__", None) or str(model)
         self._kwargs = kwargs
-
-        self._base_filter_exprs: list = list(self._global_filter_conditions[0])
-        self._base_filter_kwargs: dict = dict(self._global_filter_conditions[1])
-        self._instance_default_kwargs: dict = dict(kwargs)
+        # ``**kwargs`` is already a fresh dict and is never mutated in place.
+        self._instance_default_kwargs: dict = kwargs
 
         self.error: Exception | None = None
         self.status: SQLStatus = SQLStatus.OK
@@ -148,6 +212,18 @@ class CRUD(Generic[ModelTypeVar]):
         self._explicit_committed = False
         self._discarded = False
         self._session: SessionLike | None = None
+        self._base_query: CRUDQuery[ModelTypeVar, ModelTypeVar] | None = None
+        self._pending_rows: list[dict[str, Any]] | None = None
+
+    @property
+    def _base_filter_exprs(self) -> tuple[Any, ...]:
+        """Global positional filters shared read-only with the class."""
+        return self._global_filter_conditions[0]
+
+    @property
+    def _base_filter_kwargs(self) -> Mapping[str, Any]:
+        """Global keyword filters shared read-only with the class."""
+        return self._global_filter_conditions[1]
 
     def resolve_error_policy(self) -> ErrorPolicy:
         """Resolve the effective ``error_policy`` for this CRUD instance.
@@ -171,39 +247,28 @@ class CRUD(Generic[ModelTypeVar]):
         state = _get_txn_state(session)
         joined_existing = bool(state is not None and state.active)
         in_txn = _in_transaction(session)
-        origin_name = _get_txn_origin_name(session) if in_txn else None
 
         if joined_existing and not in_txn and state is not None:
             # Stale internal state; reset so policy can re-evaluate.
             state.active = False
             joined_existing = False
 
+        # Nested scopes (the common case under ``@CRUD.transaction``) join the
+        # active state above; only a foreign transaction goes through the policy.
         if not joined_existing:
             if in_txn:
-                policy = type(self)._existing_txn_policy
-                if policy == "error":
-                    _raise_existing_txn_error(policy=policy, origin=origin_name)
-                if policy == "join":
-                    joined_existing = True
-                elif policy == "savepoint":
-                    joined_existing = True
-                    self._nested_txn = session.begin_nested()
-                elif policy == "adopt_autobegin":
-                    if origin_name != "AUTOBEGIN":
-                        _raise_existing_txn_error(policy=policy, origin=origin_name)
-                elif policy == "reset":
-                    _reset_existing_txn(
-                        session,
-                        policy=policy,
-                        origin=origin_name,
-                    )
-                    in_txn = False
-                else:
-                    raise ValueError(f"Unsupported existing_txn_policy: {policy}")
+                joined_existing, nested, in_txn = _apply_existing_txn_policy(
+                    session, type(self)._existing_txn_policy
+                )
+                if nested is not None:
+                    self._nested_txn = nested
 
             state = _activate_txn_state(session)
             if not (joined_existing or in_txn):
                 _begin_session(session, state)
+            if not joined_existing:
+                # An adopted transaction may already carry unmarked writes.
+                _track_flushes(session, flushed=in_txn)
 
         assert state is not None
         state.depth += 1
@@ -224,6 +289,7 @@ class CRUD(Generic[ModelTypeVar]):
         logger: ErrorLogger | None = None,
         error_policy: ErrorPolicy | None = None,
         existing_txn_policy: ExistingTxnPolicy | None = None,
+        prewarm_models: Sequence[type[ORMModel]] | None = None,
     ) -> None:
         """Configure session provider, query builder, logger and defaults.
 
@@ -246,6 +312,12 @@ class CRUD(Generic[ModelTypeVar]):
                 active transaction (``\"error\"``, ``\"join\"``,
                 ``\"savepoint\"``, ``\"adopt_autobegin\"``, ``\"reset\"``).
                 See ``transaction(...)`` docstring for the detailed semantics.
+            prewarm_models: Optional models whose base read statements (with
+                the global filters registered so far) are executed once on a
+                separate connection, fetching at most one row. This configures
+                mappers and caches the compiled ``query().first()`` and plain
+                ``CRUD.first()`` statements at startup; ``all()`` and per-call
+                filter shapes still compile on first use.
         Raises:
             ValueError: If ``session_provider`` is not provided.
         """
@@ -266,6 +338,46 @@ class CRUD(Generic[ModelTypeVar]):
             cls._default_error_policy = error_policy
         if existing_txn_policy is not None:
             cls._existing_txn_policy = existing_txn_policy
+        if prewarm_models:
+            cls._prewarm(prewarm_models)
+
+    @classmethod
+    def _prewarm(cls, models: Sequence[type[ORMModel]]) -> None:
+        """Compile and cache the base read statements for ``models``.
+
+        Uses a throwaway Session bound to its own connection, so the
+        configured Session begins no transaction. The statements match what
+        the runtime emits: the ``query()`` base (``LIMIT`` is a bound
+        parameter, so ``LIMIT 0`` shares the cache entry of
+        ``query().first()``) and, when eligible, the cached ``CRUD.first()``
+        plan itself.
+        """
+        exprs, kwargs = cls._global_filter_conditions
+        engine = cls._get_engine()
+        with engine.connect() as conn, Session(bind=conn) as session:
+            for model in models:
+                if cls._query_builder is None:
+                    query = session.query(model)
+                else:
+                    built = cls._query_builder(model, session)
+                    query = built.query if isinstance(built, CRUDQuery) else built
+                if exprs:
+                    query = query.filter(*exprs)
+                if kwargs:
+                    query = query.filter_by(**kwargs)
+                query.limit(0).all()
+
+                if (
+                    cls._query_builder is None
+                    and not exprs
+                    and kwargs.keys() <= cls._column_keys(model)
+                    and None not in kwargs.values()
+                ):
+                    plan = cls._select_plan(model, (), tuple(kwargs), first=True)
+                    params = {f"g_{k}": v for k, v in kwargs.items()}
+                    # Executed as cached: a derived ``plan.limit(0)`` does not
+                    # always share the cache key of an already-executed plan.
+                    session.scalars(plan, params).first()
 
     @classmethod
     def _get_session_provider(cls) -> SessionProvider:
@@ -276,6 +388,83 @@ class CRUD(Generic[ModelTypeVar]):
             )
         return cls._session_provider[0]
 
+    @classmethod
+    def _get_engine(cls) -> Engine:
+        """Return the Engine behind the configured session provider.
+
+        A ``sessionmaker`` (or ``scoped_session`` over one) with a ``bind`` is
+        read without creating a Session. Otherwise the provider is called,
+        and a Session it produced just for this lookup (no transaction,
+        nothing loaded) is closed again. A ``Connection`` bind resolves to
+        its Engine.
+        """
+        provider = cls._get_session_provider()
+        factory = (
+            provider.session_factory
+            if isinstance(provider, scoped_session)
+            else provider
+        )
+        bind = factory.kw.get("bind") if isinstance(factory, sessionmaker) else None
+        if bind is None:
+            session = cast(Any, provider())
+            bind = session.get_bind()
+            if not (session.in_transaction() or session.identity_map or session.new):
+                session.close()
+        return cast(Engine, bind.engine)
+
+    @classmethod
+    def pool_status(cls) -> dict[str, int] | None:
+        """Return connection-pool counters for the configured session's engine.
+
+        Useful for monitoring pool saturation (``checkedout`` close to
+        ``size + max_overflow``). Pool parameters themselves belong on
+        ``create_engine(pool_size=..., max_overflow=..., pool_recycle=...,
+        pool_pre_ping=...)``; CRUD never owns the engine.
+
+        Returns:
+            ``{"size", "checkedin", "checkedout", "overflow"}`` for a
+            ``QueuePool``-backed engine, or ``None`` for pools without these
+            counters (``StaticPool``, ``NullPool``, ...).
+        """
+        pool = getattr(cls._get_engine(), "pool", None)
+        if not isinstance(pool, QueuePool):
+            return None
+        return {
+            "size": pool.size(),
+            "checkedin": pool.checkedin(),
+            "checkedout": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+
+    @classmethod
+    def prewarm_pool(cls, connections: int) -> int:
+        """Open ``connections`` pool connections up front, then check them in.
+
+        Moves connection setup (TCP, TLS, authentication) to startup so the
+        first requests do not pay for it. With ``create_engine(...,
+        pool_use_lifo=True)`` the most recently used connections are reused
+        first, so surplus idle ones can still be recycled by the server.
+
+        Args:
+            connections: Number of connections to open concurrently. For a
+                ``QueuePool`` it is clamped to ``pool_size``: overflow
+                connections are closed on check-in, and asking for more than
+                ``pool_size + max_overflow`` would block for ``pool_timeout``
+                and raise ``TimeoutError``.
+        Returns:
+            The number of connections that were opened.
+        """
+        engine = cls._get_engine()
+        pool = getattr(engine, "pool", None)
+        if isinstance(pool, QueuePool):
+            connections = min(connections, pool.size())
+        opened = 0
+        with ExitStack() as stack:
+            for _ in range(connections):
+                stack.enter_context(engine.connect())
+                opened += 1
+        return opened
+
     def _get_session(self) -> SessionLike:
         provider = self._get_session_provider()
         return cast(SessionLike, provider())
@@ -325,6 +514,7 @@ class CRUD(Generic[ModelTypeVar]):
             self._error_policy = error_policy
         if disable_global_filter is not None:
             self._apply_global_filters = not disable_global_filter
+            self._base_query = None
         return self
 
     def create_instance(self, **kwargs: Any) -> ModelTypeVar:
@@ -333,6 +523,8 @@ class CRUD(Generic[ModelTypeVar]):
         This method is intentionally stateless: every call returns a new,
         unattached model instance.
         """
+        if not self._kwargs:
+            return self._model(**kwargs)
         payload = dict(self._kwargs)
         payload.update(kwargs)
         return self._model(**payload)
@@ -389,6 +581,11 @@ class CRUD(Generic[ModelTypeVar]):
     ) -> list[ModelTypeVar] | None:
         """Bulk-insert multiple records, applying shared field updates.
 
+        Transient instances skip ``merge`` and are flushed together, so the
+        unit of work batches their INSERTs via ``insertmanyvalues`` where the
+        dialect can match RETURNING rows back to objects. For plain rows that
+        do not need to come back as instances, ``bulk_insert`` is cheaper.
+
         Args:
             instances: List of model instances to be persisted.
             **kwargs: Field updates applied to each instance before flushing.
@@ -405,11 +602,26 @@ class CRUD(Generic[ModelTypeVar]):
             session = self._require_session()
             self._ensure_nested_txn()
 
-            managed_instances: list[ModelTypeVar] = []
-            for instance in instances:
-                target = self._merge_if_needed(session, instance)
-                self._apply_updates(session, target, kwargs)
-                managed_instances.append(target)
+            if not kwargs and all(_is_transient(i) for i in instances):
+                # Freshly constructed rows: nothing to merge or update.
+                managed_instances = list(instances)
+            else:
+                managed_instances = [
+                    self._merge_if_needed(session, instance) for instance in instances
+                ]
+                if kwargs:
+                    # Validate once per model type and apply every update
+                    # under a single no_autoflush block.
+                    checked: dict[type, frozenset[str]] = {}
+                    with session.no_autoflush:
+                        for target in managed_instances:
+                            model_type = type(target)
+                            column_keys = checked.get(model_type)
+                            if column_keys is None:
+                                self._validate_update_fields(target, kwargs)
+                                column_keys = self._column_keys(model_type)
+                                checked[model_type] = column_keys
+                            _set_fields(target, kwargs, column_keys)
 
             session.add_all(managed_instances)
             session.flush()
@@ -423,6 +635,75 @@ class CRUD(Generic[ModelTypeVar]):
             self.status = SQLStatus.INTERNAL_ERR
         return None
 
+    def bulk_insert(self, rows: Sequence[Mapping[str, Any]]) -> int | None:
+        """Insert plain mappings with one ORM-enabled ``INSERT`` statement.
+
+        Unlike ``add_many``, no model instances are constructed or tracked by
+        the unit of work; SQLAlchemy batches the parameter sets (via
+        ``insertmanyvalues`` / ``executemany``) into as few round trips as the
+        dialect allows. Python-side column defaults are still applied.
+
+        Args:
+            rows: Column-keyed mappings, one per row to insert.
+        Returns:
+            The number of rows submitted, ``0`` when ``rows`` is empty, or
+            ``None`` when an error occurred and was handled according to the
+            configured ``error_policy``.
+        """
+        try:
+            if not rows:
+                return 0
+
+            session = self._require_session()
+            self._ensure_nested_txn()
+            session.execute(insert(self._model), list(rows))
+            self._need_commit = True
+            self._mark_dirty()
+            return len(rows)
+        except SQLAlchemyError as exc:
+            self._on_sql_error(exc)
+        except Exception as exc:
+            self.error = exc
+            self.status = SQLStatus.INTERNAL_ERR
+        return None
+
+    def queue_insert(self, **kwargs: Any) -> None:
+        """Buffer a row for a single multi-row ``INSERT`` issued later.
+
+        Queued rows (default kwargs merged with ``kwargs``, as in
+        ``create_instance``) are inserted together through ``bulk_insert``
+        when the context commits, on ``commit()`` or on ``flush_queued()``.
+        Unlike ``add``, no instance is returned and the rows are not visible
+        to queries in this scope until flushed; ``discard()`` drops them.
+
+        Raises:
+            RuntimeError: If called outside a ``with CRUD(...)`` scope, where
+                the rows could never be flushed.
+        """
+        self._require_session()
+        self._ensure_nested_txn()
+        payload = dict(self._kwargs)
+        payload.update(kwargs)
+        if self._pending_rows is None:
+            self._pending_rows = [payload]
+        else:
+            self._pending_rows.append(payload)
+        self._need_commit = True
+        self._mark_dirty()
+
+    def flush_queued(self) -> int | None:
+        """Insert rows buffered by ``queue_insert`` now.
+
+        Returns:
+            The value of ``bulk_insert`` for the queued rows (``0`` when
+            nothing is queued).
+        """
+        rows = self._pending_rows
+        if not rows:
+            return 0
+        self._pending_rows = None
+        return self.bulk_insert(rows)
+
     def query(
         self, *args, pure: bool = False, **kwargs
     ) -> CRUDQuery[ModelTypeVar, ModelTypeVar]:
@@ -439,19 +720,27 @@ class CRUD(Generic[ModelTypeVar]):
         Returns:
             A ``CRUDQuery`` wrapping the underlying SQLAlchemy ``Query``.
         """
-        session = self._require_session()
-        base_query = self._get_query_builder()(self._model, session)
-        query = cast(
-            Query, base_query.query if isinstance(base_query, CRUDQuery) else base_query
-        )
-        if not pure:
-            if self._instance_default_kwargs:
-                query = query.filter_by(**self._instance_default_kwargs)
-            if self._apply_global_filters:
-                if self._base_filter_exprs:
-                    query = query.filter(*self._base_filter_exprs)
-                if self._base_filter_kwargs:
-                    query = query.filter_by(**self._base_filter_kwargs)
+        if pure:
+            query = self._build_query()
+        else:
+            # Queries and CRUDQuery wrappers are generative, so the prefiltered
+            # one is safe to reuse for the rest of this context and is returned
+            # as-is when no extra criteria are given; it is dropped on
+            # exit/config().
+            base = self._base_query
+            if base is None:
+                query = self._build_query()
+                if self._instance_default_kwargs:
+                    query = query.filter_by(**self._instance_default_kwargs)
+                if self._apply_global_filters:
+                    if self._base_filter_exprs:
+                        query = query.filter(*self._base_filter_exprs)
+                    if self._base_filter_kwargs:
+                        query = query.filter_by(**self._base_filter_kwargs)
+                base = self._base_query = CRUDQuery(self, query)
+            if not (args or kwargs):
+                return base
+            query = base.query
 
         final_query = query
         try:
@@ -468,6 +757,17 @@ class CRUD(Generic[ModelTypeVar]):
             self._log(exc, self.status)
         return CRUDQuery(self, final_query)
 
+    def _build_query(self) -> Query:
+        """Return a fresh, unfiltered ``Query`` from the configured builder."""
+        session = self._require_session()
+        if self._query_builder is None:
+            # Default builder: skip the throwaway closure and CRUDQuery wrapper.
+            return cast(Query, session.query(self._model))
+        base_query = self._get_query_builder()(self._model, session)
+        return cast(
+            Query, base_query.query if isinstance(base_query, CRUDQuery) else base_query
+        )
+
     def first(
         self, query: CRUDQuery[ModelTypeVar, ModelTypeVar] | None = None
     ) -> ModelTypeVar | None:
@@ -481,9 +781,77 @@ class CRUD(Generic[ModelTypeVar]):
             or an error occurred and was handled according to ``error_policy``.
         """
         if query is None:
+            planned = self._run_plan(first=True)
+            if planned is not _NO_PLAN:
+                return cast(ModelTypeVar | None, planned)
             query = self.query()
         return query.first()
 
+    def _run_plan(self, *, first: bool) -> Any:
+        """Run ``first()``/``all()`` for keyword-only default filters via a cached plan.
+
+        The ``SELECT`` (with ``LIMIT 1`` for ``first``) for a
+        ``(model, filter keys, first)`` signature is built once and
+        re-executed with fresh bound values, skipping ``Query`` construction.
+        Returns ``_NO_PLAN`` when a custom query builder, positional global
+        filters, non-column keys (relationships, hybrids; ``filter_by``
+        resolves those) or ``None`` values (``IS NULL`` semantics) require the
+        regular ``query()`` path.
+        """
+        if self._query_builder is not None:
+            return _NO_PLAN
+        global_kwargs: Mapping[str, Any] = {}
+        if self._apply_global_filters:
+            if self._base_filter_exprs:
+                return _NO_PLAN
+            global_kwargs = self._base_filter_kwargs
+
+        column_keys = self._column_keys(self._model)
+        if not (
+            self._instance_default_kwargs.keys() <= column_keys
+            and global_kwargs.keys() <= column_keys
+        ):
+            return _NO_PLAN
+
+        params = {f"i_{k}": v for k, v in self._instance_default_kwargs.items()}
+        params.update((f"g_{k}", v) for k, v in global_kwargs.items())
+        if any(value is None for value in params.values()):
+            return _NO_PLAN
+
+        plan = self._select_plan(
+            self._model,
+            tuple(self._instance_default_kwargs),
+            tuple(global_kwargs),
+            first=first,
+        )
+        session = self._require_session()
+        # unique() matches Query.first()/all() when joined eager loads are in play.
+        result = session.scalars(plan, params).unique()
+        return result.first() if first else result.all()
+
+    @classmethod
+    def _select_plan(
+        cls,
+        model: Any,
+        instance_keys: tuple[str, ...],
+        global_keys: tuple[str, ...],
+        *,
+        first: bool,
+    ) -> Select:
+        """Return (and cache) the bound-parameter ``SELECT`` for a signature."""
+        key = (model, frozenset(instance_keys), frozenset(global_keys), first)
+        plan = cls._plan_cache.get(key)
+        if plan is None:
+            criteria = [getattr(model, k) == bindparam(f"i_{k}") for k in instance_keys]
+            criteria.extend(
+                getattr(model, k) == bindparam(f"g_{k}") for k in global_keys
+            )
+            plan = select(model).where(*criteria)
+            if first:
+                plan = plan.limit(1)
+            cls._plan_cache[key] = plan
+        return plan
+
     def all(
         self, query: CRUDQuery[ModelTypeVar, ModelTypeVar] | None = None
     ) -> list[ModelTypeVar]:
@@ -495,11 +863,84 @@ class CRUD(Generic[ModelTypeVar]):
         Returns:
             A list of matched model instances (possibly empty). Errors are
             handled according to the configured ``error_policy``.
+
+        Column-only keyword defaults are served from the cached plan shared
+        with ``first()``; other defaults go through ``self.query()``.
         """
         if query is None:
+            planned = self._run_plan(first=False)
+            if planned is not _NO_PLAN:
+                return cast(list[ModelTypeVar], planned)
             query = self.query()
         return query.all()
 
+    def iter_all(
+        self,
+        query: CRUDQuery[ModelTypeVar, ModelTypeVar] | None = None,
+        batch: int = 1000,
+    ) -> Iterator[ModelTypeVar]:
+        """Stream all records in ``batch``-sized fetches instead of one list.
+
+        Args:
+            query: Optional existing ``CRUDQuery`` to execute. When ``None``,
+                this method internally calls ``self.query()``.
+            batch: Number of rows buffered per fetch (``Query.yield_per``).
+        Returns:
+            An iterator over matched model instances. It must be consumed
+            inside the ``with CRUD(...)`` context.
+        """
+        if query is None:
+            query = self.query()
+        return query.stream(batch)
+
+    def get(self, pk: Any) -> ModelTypeVar | None:
+        """Return the instance identified by ``pk`` via ``Session.get``.
+
+        The identity map is consulted first, so already-loaded rows are
+        returned without emitting SQL or building a ``Query``. When global
+        filters are registered (and not disabled via ``config``), the lookup
+        goes through a primary-key query instead so those filters still
+        apply. Instance-level default filters are **not** applied.
+
+        Args:
+            pk: Primary key value (or tuple/dict for composite keys).
+        Returns:
+            The matched model instance, or ``None`` if no row exists or an
+            error occurred and was handled according to ``error_policy``.
+        """
+        try:
+            session = self._require_session()
+            if self._apply_global_filters and (
+                self._base_filter_exprs or self._base_filter_kwargs
+            ):
+                return self._get_filtered(pk)
+            return session.get(self._model, pk)
+        except SQLAlchemyError as exc:
+            self._on_sql_error(exc)
+        except Exception as exc:
+            self.error = exc
+            self.status = SQLStatus.INTERNAL_ERR
+        return None
+
+    def _get_filtered(self, pk: Any) -> ModelTypeVar | None:
+        """Load ``pk`` through a query carrying the global filters."""
+        mapper = sa_inspect(self._model)
+        columns = mapper.primary_key
+        if isinstance(pk, Mapping):
+            values = [pk[mapper.get_property_by_column(c).key] for c in columns]
+        elif isinstance(pk, (tuple, list)):
+            values = list(pk)
+        else:
+            values = [pk]
+
+        query = self._build_query()
+        if self._base_filter_exprs:
+            query = query.filter(*self._base_filter_exprs)
+        if self._base_filter_kwargs:
+            query = query.filter_by(**self._base_filter_kwargs)
+        criteria = [c == v for c, v in zip(columns, values, strict=True)]
+        return cast(ModelTypeVar | None, query.filter(*criteria).first())
+
     def update(
         self, instance: ModelTypeVar | None = None, **kwargs
     ) -> ModelTypeVar | None:
@@ -535,12 +976,87 @@ class CRUD(Generic[ModelTypeVar]):
             self.status = SQLStatus.INTERNAL_ERR
         return None
 
+    def update_many(
+        self,
+        query: CRUDQuery[ModelTypeVar, ModelTypeVar] | None = None,
+        sync: _orm_types.SynchronizeSessionArgument = "auto",
+        **values: Any,
+    ) -> int | None:
+        """Update every record matched by ``query`` with a single ``UPDATE``.
+
+        No instances are loaded and no per-row attribute events fire; the
+        statement is emitted through ``Query.update``.
+
+        Args:
+            query: Optional query selecting the rows to update. When ``None``,
+                this method internally calls ``self.query()``.
+            sync: Synchronization strategy passed through to SQLAlchemy's
+                ``Query.update`` (``"auto"``, ``"evaluate"``, ``"fetch"`` or
+                ``False``).
+            **values: Column values (or SQL expressions) to assign.
+        Returns:
+            The number of matched rows reported by the database, or ``None``
+            when an error occurred and was handled according to the
+            configured ``error_policy``.
+        """
+        try:
+            if query is None:
+                query = self.query()
+            if not values:
+                return 0
+
+            self._require_session()
+            self._ensure_nested_txn()
+            rowcount = query.update(values, synchronize_session=sync)
+            self._need_commit = True
+            self._mark_dirty()
+            return rowcount
+        except SQLAlchemyError as exc:
+            self._on_sql_error(exc)
+        except Exception as exc:
+            self.error = exc
+            self.status = SQLStatus.INTERNAL_ERR
+        return None
+
+    def bulk_update(self, rows: Sequence[Mapping[str, Any]]) -> int | None:
+        """Apply per-row values with one ORM bulk ``UPDATE`` by primary key.
+
+        Each mapping must contain the primary key column(s) plus the columns
+        to set; rows may set different values. SQLAlchemy executes them as a
+        single ``UPDATE ... WHERE pk = ?`` ``executemany`` instead of loading
+        and flushing one instance per row. Use ``update_many`` when every
+        matched row receives the same values.
+
+        Args:
+            rows: Column-keyed mappings, one per row to update.
+        Returns:
+            The number of rows submitted, ``0`` when ``rows`` is empty, or
+            ``None`` when an error occurred and was handled according to the
+            configured ``error_policy``.
+        """
+        try:
+            if not rows:
+                return 0
+
+            session = self._require_session()
+            self._ensure_nested_txn()
+            session.execute(update(self._model), list(rows))
+            self._need_commit = True
+            self._mark_dirty()
+            return len(rows)
+        except SQLAlchemyError as exc:
+            self._on_sql_error(exc)
+        except Exception as exc:
+            self.error = exc
+            self.status = SQLStatus.INTERNAL_ERR
+        return None
+
     def delete(
         self,
         instance: ModelTypeVar | None = None,
         query: CRUDQuery[ModelTypeVar, ModelTypeVar] | None = None,
         all_records: bool = False,
-        sync: _orm_types.SynchronizeSessionArgument = "fetch",
+        sync: _orm_types.SynchronizeSessionArgument = "auto",
     ) -> bool:
         """Delete a single record or multiple records.
 
@@ -552,7 +1068,12 @@ class CRUD(Generic[ModelTypeVar]):
             all_records: When ``True``, delete all records matched by ``query``;
                 when ``False``, delete only the first matched record.
             sync: Synchronization strategy passed through to SQLAlchemy's
-                ``Query.delete`` when ``all_records=True``.
+                ``Query.delete`` when ``all_records=True``. ``"auto"`` avoids
+                the extra primary-key SELECT where the criteria can be
+                evaluated in Python; pass ``"fetch"`` when other code still
+                holds references to deleted objects that must be expunged,
+                or ``False`` to skip synchronization when no objects loaded
+                from the matched rows are used again in this Session.
         Returns:
             ``True`` if deletion was attempted and the transaction was marked
             dirty; ``False`` when no target was found or an error occurred and
@@ -567,15 +1088,18 @@ class CRUD(Generic[ModelTypeVar]):
                 if query is None:
                     query = self.query()
 
-                first_inst = query.first()
-                if not first_inst:
-                    self.status = SQLStatus.NOT_FOUND
-                    return False
-
-                self._ensure_nested_txn()
                 if all_records:
-                    query.delete(synchronize_session=sync)
+                    # The DELETE's rowcount doubles as the existence check.
+                    self._ensure_nested_txn()
+                    if not query.delete(synchronize_session=sync):
+                        self.status = SQLStatus.NOT_FOUND
+                        return False
                 else:
+                    first_inst = query.first()
+                    if not first_inst:
+                        self.status = SQLStatus.NOT_FOUND
+                        return False
+                    self._ensure_nested_txn()
                     session.delete(first_inst)
 
             self._need_commit = True
@@ -608,8 +1132,11 @@ class CRUD(Generic[ModelTypeVar]):
         """
         try:
             session = self._require_session()
-            if self._nested_txn and getattr(self._nested_txn, "is_active", False):
-                self._nested_txn.commit()
+            if self._pending_rows and self.flush_queued() is None:
+                return
+            nested = self._nested_txn
+            if nested is not None and nested.is_active:
+                nested.commit()
             else:
                 session.commit()
             self._explicit_committed = True
@@ -617,7 +1144,8 @@ class CRUD(Generic[ModelTypeVar]):
         except Exception as exc:
             self._logger("CRUD commit failed: %s", exc)
             if self._session is not None:
-                self._session.rollback()
+                with suppress(Exception):
+                    self._session.rollback()
 
     def discard(self) -> None:
         """Explicitly roll back the current transaction and discard changes.
@@ -626,10 +1154,12 @@ class CRUD(Generic[ModelTypeVar]):
         - Uses the internal ``_discarded`` flag so that ``__exit__`` knows to
           roll back.
         """
+        self._pending_rows = None
         try:
             session = self._require_session()
-            if self._nested_txn and getattr(self._nested_txn, "is_active", False):
-                self._nested_txn.rollback()
+            nested = self._nested_txn
+            if nested is not None and nested.is_active:
+                nested.rollback()
             else:
                 session.rollback()
         finally:
@@ -643,10 +1173,9 @@ class CRUD(Generic[ModelTypeVar]):
 
     def _log(self, error: Exception, status: SQLStatus = SQLStatus.INTERNAL_ERR):
         """Log an error related to the current model."""
-        model_name = getattr(self._model, "__name__", str(self._model))
         self._logger(
             "CRUD[%s]: <catch: %s> <except: (%s)>",
-            model_name,
+            self._model_name,
             error,
             status,
         )
@@ -657,33 +1186,64 @@ class CRUD(Generic[ModelTypeVar]):
         # and handled by the transaction decorator or ``_on_sql_error``.
         if self.error and not isinstance(self.error, SQLAlchemyError):
             raise self.error
+        queued_error: SQLAlchemyError | None = None
         try:
+            if self._pending_rows and exc_type is None and not self._discarded:
+                queued_error = self._insert_pending_rows()
+
+            if (
+                exc_type is None
+                and self.error is None
+                and not self._need_commit
+                and not self._discarded
+            ):
+                # Read-only scope: only the shared depth needs unwinding, plus
+                # ending the read transaction this scope began so the
+                # connection goes back to the pool instead of idling in BEGIN.
+                # That commit honours ``expire_on_commit``: with the default
+                # (True) instances read here come back expired and reload on
+                # next attribute access (DetachedInstanceError once closed).
+                # Changes made on the Session without ``mark_for_commit()``
+                # are never committed here; the transaction is left open.
+                state = self._txn_state
+                session = self._session
+                if session is not None and state is not None and state.active:
+                    state.depth -= 1
+                    if state.depth <= 0:
+                        state.active = False
+                        if not self._joined_existing and (
+                            state.dirty or not _has_unmarked_changes(session)
+                        ):
+                            _commit_session(session, self._logger)
+                return
+
             has_exc = bool(exc_type or exc_val or exc_tb)
             should_rollback = has_exc or self.error is not None or self._discarded
+            # Only a still-active SAVEPOINT needs commit/rollback here.
+            nested = self._nested_txn
+            if nested is not None and not nested.is_active:
+                nested = None
 
             if should_rollback:
                 if has_exc or self.error:
-                    model_name = getattr(self._model, "__name__", str(self._model))
                     self._logger(
                         "CRUD[%s]: <catch: %s> <except: (%s: %s)>",
-                        model_name,
+                        self._model_name,
                         self.error,
                         exc_type,
                         exc_val,
                     )
-                if self._nested_txn and getattr(self._nested_txn, "is_active", False):
+                if nested is not None:
                     try:
-                        self._nested_txn.rollback()
+                        nested.rollback()
                     except Exception:
                         # Log and continue to top-level rollback handling.
                         self._logger("CRUD sub-txn rollback failed", exc_info=True)
                 self._need_commit = False
             elif self._need_commit and not self._explicit_committed:
                 try:
-                    if self._nested_txn and getattr(
-                        self._nested_txn, "is_active", False
-                    ):
-                        self._nested_txn.commit()
+                    if nested is not None:
+                        nested.commit()
                 except Exception as exc:
                     self._logger("CRUD sub-txn commit failed: %s", exc)
                     raise
@@ -692,80 +1252,138 @@ class CRUD(Generic[ModelTypeVar]):
             # scope performs commit/rollback on the Session.
             if self._session is not None:
                 session = self._session
-                state = _get_txn_state(session)
-                joined_existing = getattr(self, "_joined_existing", False)
+                # Resolved once in __enter__; no second ContextVar map lookup.
+                state = self._txn_state
+                joined_existing = self._joined_existing
 
                 if state is not None and state.active:
                     state.depth -= 1
                     is_outermost = state.depth <= 0
                     if is_outermost:
                         state.active = False
-                        try:
-                            if should_rollback and not joined_existing:
-                                session.rollback()
-                            elif (
-                                self._need_commit
-                                and not self._explicit_committed
-                                and not joined_existing
-                            ):
-                                session.commit()
-                        except Exception as exc:
-                            self._logger("CRUD commit/rollback failed: %s", exc)
+                        if joined_existing:
+                            # The outer owner ends the transaction.
+                            pass
+                        elif should_rollback:
                             try:
                                 session.rollback()
-                            except Exception:
-                                pass
-                            raise
+                            except Exception as exc:
+                                self._logger("CRUD commit/rollback failed: %s", exc)
+                                raise
+                        elif self._need_commit and not self._explicit_committed:
+                            _commit_session(session, self._logger)
+
+            if queued_error is not None and self.resolve_error_policy() == "raise":
+                raise queued_error
         finally:
             # Session lifecycle is owned by the outer application/framework.
             self._session = None
+            self._txn_state = None
+            self._base_query = None
+            self._pending_rows = None
+
+    def _insert_pending_rows(self) -> SQLAlchemyError | None:
+        """Insert queued rows on exit, recording instead of raising failures.
+
+        A failure is stored on ``error`` so the rest of ``__exit__`` takes
+        the rollback path; the caller re-raises it after cleanup.
+        """
+        rows = self._pending_rows
+        self._pending_rows = None
+        try:
+            self._ensure_nested_txn()
+            self._require_session().execute(insert(self._model), rows)
+        except SQLAlchemyError as exc:
+            self.error = exc
+            self.status = SQLStatus.SQL_ERR
+            return exc
+        return None
 
     def _ensure_nested_txn(self) -> None:
-        """Ensure there is an active SAVEPOINT / nested transaction if possible."""
-        if not (self._nested_txn and self._nested_txn.is_active):
-            try:
-                session = self._require_session()
-                self._nested_txn = session.begin_nested()
-            except Exception:
-                self._nested_txn = None
+        """Ensure there is an active SAVEPOINT / nested transaction if possible.
+
+        The outermost scope that began the Session transaction itself skips
+        the SAVEPOINT: rolling back that scope already discards everything,
+        so the extra ``SAVEPOINT``/``RELEASE`` round trips buy nothing.
+        """
+        nested = self._nested_txn
+        if nested is not None and nested.is_active:
+            return
+        state = self._txn_state
+        if state is not None and state.depth == 1 and not self._joined_existing:
+            return
+        try:
+            self._nested_txn = self._require_session().begin_nested()
+        except Exception:
+            self._nested_txn = None
 
     def _merge_if_needed(
         self, session: SessionLike, instance: ModelTypeVar
     ) -> ModelTypeVar:
-        """Attach an instance to the current Session when necessary."""
-        insp = cast(Any, sa_inspect(instance))
-        bound_sess = object_session(instance)
-        need_merge = (not insp.transient) or (
-            bound_sess is not None and bound_sess is not session
-        )
-        if need_merge:
+        """Attach an instance to the current Session when necessary.
+
+        Transient instances (the common ``add`` path) and instances already
+        owned by ``session`` are returned as-is after a plain attribute check;
+        everything else is merged.
+        """
+        state = getattr(instance, "_sa_instance_state", None)
+        if state is None:
             return cast(ModelTypeVar, session.merge(instance))
-        return instance
+        if state.transient:
+            return instance
+        hash_key = getattr(session, "hash_key", None)
+        if hash_key is not None and state.session_id == hash_key:
+            return instance
+        return cast(ModelTypeVar, session.merge(instance))
+
+    @classmethod
+    def _column_keys(cls, model_type: type) -> frozenset[str]:
+        """Return (and cache) the mapped column attribute keys of ``model_type``."""
+        keys = cls._column_keys_cache.get(model_type)
+        if keys is None:
+            keys = frozenset(sa_inspect(model_type).column_attrs.keys())
+            cls._column_keys_cache[model_type] = keys
+        return keys
 
     def _validate_update_fields(
         self, instance: ModelTypeVar, updates: dict[str, Any]
     ) -> None:
         """Fail fast on unknown attributes to avoid silent no-op writes."""
         model_type = type(instance)
+        column_keys = self._column_keys(model_type)
         for key in updates:
-            if not hasattr(model_type, key):
+            if key not in column_keys and not hasattr(model_type, key):
                 raise AttributeError(f"{model_type.__name__} has no attribute '{key}'")
 
     def _apply_updates(
         self, session: SessionLike, instance: ModelTypeVar, updates: dict[str, Any]
     ) -> None:
-        """Apply field updates under no_autoflush to avoid premature flushes."""
+        """Apply field updates, guarding against premature autoflush.
+
+        Mapped columns go through ``set_attribute`` directly (same history and
+        events, no descriptor hop); relationships, hybrids and plain Python
+        attributes keep using ``setattr``. ``no_autoflush`` is skipped when
+        nothing can lazy-load: only column keys, and either no database
+        identity yet or every key already loaded.
+        """
         if not updates:
             return
         self._validate_update_fields(instance, updates)
+        column_keys = self._column_keys(type(instance))
+        keys = updates.keys()
+        if keys <= column_keys:
+            state = sa_inspect(instance)
+            if state.key is None or keys <= state.dict.keys():
+                _set_fields(instance, updates, column_keys)
+                return
         with session.no_autoflush:
-            for key, value in updates.items():
-                setattr(instance, key, value)
+            _set_fields(instance, updates, column_keys)
 
     def _mark_dirty(self) -> None:
-        # The current transaction join/depth is managed by the shared
-        # transaction state machine; this is a placeholder for future hooks.
-        return
+        # Lets a read-only outermost scope commit writes made by joined scopes.
+        state = self._txn_state
+        if state is not None:
+            state.dirty = True
 
     def _on_sql_error(self, e: Exception) -> None:
         """Handle a ``SQLAlchemyError`` and optionally re-raise it."""
@@ -773,8 +1391,9 @@ class CRUD(Generic[ModelTypeVar]):
         self.status = SQLStatus.SQL_ERR
         try:
             session = self._require_session()
-            if self._nested_txn and getattr(self._nested_txn, "is_active", False):
-                self._nested_txn.rollback()
+            nested = self._nested_txn
+            if nested is not None and nested.is_active:
+                nested.rollback()
             else:
                 session.rollback()
         except Exception:
@@ -801,6 +1420,8 @@ class CRUD(Generic[ModelTypeVar]):
           semantics and commit/rollback behaviour.
         - ``existing_txn_policy`` can override how to handle an already-active
           transaction for this decorator invocation.
+        - Decorators are memoized per class and resolved options, so calling
+          this per request does not rebuild the helper's closures.
         """
 
         resolved_policy: ErrorPolicy = (
@@ -812,14 +1433,21 @@ class CRUD(Generic[ModelTypeVar]):
             else cls._existing_txn_policy
         )
 
+        key = (cls, resolved_policy, join_existing, resolved_existing_txn_policy)
+        decorator = cls._txn_decorator_cache.get(key)
+        if decorator is not None:
+            return cast(TransactionDecorator[P, R], decorator)
+
         def session_factory() -> SessionLike:
             provider = cls._get_session_provider()
             return provider()
 
-        return _txn_transaction(
+        decorator = _txn_transaction(
             session_factory,
             join_existing=join_existing,
             # nested=nested,
             error_policy=resolved_policy,
             existing_txn_policy=resolved_existing_txn_policy,
         )
+        cls._txn_decorator_cache[key] = decorator
+        return decorator
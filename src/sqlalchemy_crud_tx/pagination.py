@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Generic, Protocol, TypeVar
+from typing import Any, Generic, Protocol, TypeVar, cast
+
+from sqlalchemy import Select, func
 
 _T = TypeVar("_T")
 
@@ -23,6 +25,16 @@ class PaginationResult(Generic[_T]):
     next_num: int | None
 
 
+@dataclass(slots=True)
+class KeysetPaginationResult(Generic[_T]):
+    """Keyset (seek) pagination payload returned by ``CRUDQuery.paginate_keyset``."""
+
+    items: list[_T]
+    per_page: int
+    has_next: bool
+    next_cursor: Any | None
+
+
 class _PaginationQuery(Protocol[_T]):
     def count(self) -> int: ...
 
@@ -33,6 +45,49 @@ class _PaginationQuery(Protocol[_T]):
     def all(self) -> list[_T]: ...
 
 
+class _KeysetQuery(Protocol[_T]):
+    def filter(self, *criterion: Any) -> "_KeysetQuery[_T]": ...
+
+    def order_by(self, *clauses: Any) -> "_KeysetQuery[_T]": ...
+
+    def limit(self, limit: int | None) -> "_KeysetQuery[_T]": ...
+
+    def all(self) -> list[_T]: ...
+
+
+_MISSING = object()
+
+
+def _is_plain_select(stmt: Select) -> bool:
+    """Return whether ``COUNT(*)`` can replace the selected columns directly.
+
+    DISTINCT, GROUP BY/HAVING and LIMIT/OFFSET change the row count of the
+    outer query, so those shapes keep the subquery-wrapping ``Query.count``.
+    ``Select`` exposes no public accessors for them; the private attributes
+    are read defensively, and any that are missing count as "not plain".
+    """
+    for name in ("_distinct", "_group_by_clauses", "_having_criteria"):
+        value = getattr(stmt, name, _MISSING)
+        if value is _MISSING or value:
+            return False
+    return all(
+        getattr(stmt, name, _MISSING) is None
+        for name in ("_limit_clause", "_offset_clause")
+    )
+
+
+def _can_window_count(query: Any) -> bool:
+    """Return whether ``COUNT(*) OVER ()`` on ``query`` equals its ``count()``.
+
+    The window is evaluated before DISTINCT and the query's own LIMIT/OFFSET,
+    so only plain single-entity selects qualify.
+    """
+    if not getattr(query, "is_single_entity", False):
+        return False
+    stmt = getattr(query, "statement", None)
+    return isinstance(stmt, Select) and _is_plain_select(stmt)
+
+
 def paginate_query(
     query: _PaginationQuery[_T],
     *,
@@ -41,8 +96,18 @@ def paginate_query(
     error_out: bool = False,
     max_per_page: int | None = None,
     count: bool = True,
+    window_count: bool = False,
 ) -> PaginationResult[_T]:
-    """Paginate results using generic ``count/limit/offset/all`` operations."""
+    """Paginate results using generic ``count/limit/offset/all`` operations.
+
+    With ``window_count=True`` and a single-entity SQLAlchemy query, the total
+    is read from a ``COUNT(*) OVER ()`` column on the page query itself, so
+    one round trip returns both items and total; a separate ``count()`` is
+    only issued when a page past the first comes back empty. The window is
+    computed before DISTINCT, so queries with DISTINCT, GROUP BY/HAVING or
+    their own LIMIT/OFFSET fall back to ``count()``. Do not combine it with
+    joined eager loading of collections, which multiplies rows.
+    """
     if max_per_page is not None:
         per_page = min(per_page, max_per_page)
 
@@ -60,11 +125,27 @@ def paginate_query(
     prev_num = page - 1 if has_prev else None
 
     if count:
-        total = query.count()
+        items: list[_T] | None = None
+        if window_count and _can_window_count(query):
+            rows = (
+                cast(Any, query)
+                .add_columns(func.count().over())
+                .limit(per_page)
+                .offset(offset)
+                .all()
+            )
+            items = [row[0] for row in rows]
+            if rows:
+                total = int(rows[0][1])
+            else:
+                total = query.count() if offset else 0
+        else:
+            total = query.count()
         pages = (total + per_page - 1) // per_page if total > 0 else 0
         if error_out and total > 0 and page > pages:
             raise ValueError("page is out of range")
-        items = query.limit(per_page).offset(offset).all()
+        if items is None:
+            items = query.limit(per_page).offset(offset).all()
         has_next = page < pages
         next_num = page + 1 if has_next else None
         return PaginationResult(
@@ -94,3 +175,41 @@ def paginate_query(
         prev_num=prev_num,
         next_num=next_num,
     )
+
+
+def paginate_keyset(
+    query: _KeysetQuery[_T],
+    column: Any,
+    *,
+    cursor: Any | None = None,
+    per_page: int = 20,
+    error_out: bool = False,
+    max_per_page: int | None = None,
+) -> KeysetPaginationResult[_T]:
+    """Paginate results by seeking past ``cursor`` on an ordered ``column``.
+
+    Emits ``WHERE column > :cursor ORDER BY column LIMIT per_page + 1``, so the
+    cost of a page does not grow with its depth the way ``OFFSET`` does.
+    ``column`` should be unique (or made unique by the caller) and the query
+    should not carry its own ``ORDER BY``. Pass the returned ``next_cursor``
+    back as ``cursor`` to fetch the following page.
+    """
+    if max_per_page is not None:
+        per_page = min(per_page, max_per_page)
+    if per_page < 1:
+        if error_out:
+            raise ValueError("per_page must be >= 1")
+        per_page = 20
+
+    if cursor is not None:
+        query = query.filter(column > cursor)
+    batch = query.order_by(column).limit(per_page + 1).all()
+    has_next = len(batch) > per_page
+    items = batch[:per_page] if has_next else batch
+    next_cursor = getattr(items[-1], column.key) if has_next else None
+    return KeysetPaginationResult(
+        items=items,
+        per_page=per_page,
+        has_next=has_next,
+        next_cursor=next_cursor,
+    )
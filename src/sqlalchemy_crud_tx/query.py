@@ -2,11 +2,19 @@
 
 from collections.abc import Iterator
 from functools import wraps
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
 
+from sqlalchemy import Row, Select, func
 from sqlalchemy.orm import Query
 
-from .pagination import PaginationResult, paginate_query
+from .pagination import (
+    KeysetPaginationResult,
+    PaginationResult,
+    _is_plain_select,
+    paginate_keyset,
+    paginate_query,
+)
 from .types import ORMModel
 
 if TYPE_CHECKING:
@@ -26,6 +34,8 @@ class CRUDQuery(Generic[ModelTypeVar, ResultTypeVar_co]):
     - Adds type parameters and a chainable interface.
     - Delegates unknown attributes/methods to the wrapped ``Query``.
     - Terminal methods (``first/all/...``) call the underlying ``Query``.
+    - Builder methods return a new wrapper and never mutate ``self``, so a
+      partially built query can be shared and extended safely.
     """
 
     __slots__ = ("_crud", "_query")
@@ -131,6 +141,20 @@ class CRUDQuery(Generic[ModelTypeVar, ResultTypeVar_co]):
         """Return all results from the underlying query."""
         return self._query.all()
 
+    def stream(self, batch: int = 1000) -> Iterator[ResultTypeVar_co]:
+        """Iterate results fetched ``batch`` rows at a time via ``yield_per``.
+
+        Memory stays proportional to ``batch`` instead of the result size;
+        prefer this over ``all()`` for scans of more than ~10k rows.
+        """
+        return iter(self._query.yield_per(batch))
+
+    def iter_chunks(self, batch: int = 1000) -> Iterator[list[ResultTypeVar_co]]:
+        """Stream results as lists of at most ``batch`` items."""
+        rows = self.stream(batch)
+        while chunk := list(islice(rows, batch)):
+            yield chunk
+
     def first(self) -> ResultTypeVar_co | None:
         """Return the first result (or ``None``) from the underlying query."""
         return self._query.first()
@@ -148,9 +172,32 @@ class CRUDQuery(Generic[ModelTypeVar, ResultTypeVar_co]):
         result = self._query.scalar()
         return cast(ResultTypeVar_co | None, result)
 
+    def columns(self, *columns: Any) -> list[Row[Any]]:
+        """Return only ``columns`` for the matched rows as Core ``Row`` tuples.
+
+        The query's filters, joins and ordering are kept, but the statement is
+        executed through ``Session.execute`` so no ORM instances are built or
+        added to the identity map.
+        """
+        stmt = self._query.statement.with_only_columns(
+            *columns, maintain_column_froms=True
+        )
+        return list(self._query.session.execute(stmt).all())
+
     def count(self) -> int:
-        """Return the row count for the underlying query."""
-        return self._query.count()
+        """Return the row count for the underlying query.
+
+        Plain queries are counted with ``SELECT count(*) FROM ... WHERE ...``
+        instead of ``Query.count``'s ``SELECT count(*) FROM (SELECT ...)``
+        wrapper; other shapes fall back to ``Query.count``.
+        """
+        stmt = self._query.statement
+        if not isinstance(stmt, Select) or not _is_plain_select(stmt):
+            return self._query.count()
+        count_stmt = stmt.with_only_columns(
+            func.count(), maintain_column_froms=True
+        ).order_by(None)
+        return int(self._query.session.scalar(count_stmt) or 0)
 
     def paginate(
         self,
@@ -160,6 +207,7 @@ class CRUDQuery(Generic[ModelTypeVar, ResultTypeVar_co]):
         error_out: bool = False,
         max_per_page: int | None = None,
         count: bool = True,
+        window_count: bool = False,
     ) -> PaginationResult[ResultTypeVar_co]:
         """Paginate query results with the library's built-in paginator."""
         return paginate_query(
@@ -169,6 +217,26 @@ class CRUDQuery(Generic[ModelTypeVar, ResultTypeVar_co]):
             error_out=error_out,
             max_per_page=max_per_page,
             count=count,
+            window_count=window_count,
+        )
+
+    def paginate_keyset(
+        self,
+        column: Any,
+        *,
+        cursor: Any | None = None,
+        per_page: int = 20,
+        error_out: bool = False,
+        max_per_page: int | None = None,
+    ) -> KeysetPaginationResult[ResultTypeVar_co]:
+        """Paginate by seeking past ``cursor`` on ``column`` instead of OFFSET."""
+        return paginate_keyset(
+            self,
+            column,
+            cursor=cursor,
+            per_page=per_page,
+            error_out=error_out,
+            max_per_page=max_per_page,
         )
 
     def raw(self) -> Query:
@@ -199,3 +267,82 @@ class CRUDQuery(Generic[ModelTypeVar, ResultTypeVar_co]):
 
     def __repr__(self) -> str:
         return f"CRUDQuery({self._query!r})"
+
+
+# Generative ``Query`` methods without an explicit wrapper above. Forwarders
+# are generated once at import so chained calls skip ``__getattr__`` and its
+# per-call closure; ``__getattr__`` remains the fallback for everything else.
+_GENERATIVE_QUERY_METHODS = (
+    "add_columns",
+    "add_entity",
+    "autoflush",
+    "correlate",
+    "enable_assertions",
+    "except_",
+    "except_all",
+    "from_statement",
+    "intersect",
+    "intersect_all",
+    "only_return_tuples",
+    "params",
+    "populate_existing",
+    "prefix_with",
+    "set_label_style",
+    "slice",
+    "suffix_with",
+    "tuples",
+    "union",
+    "union_all",
+    "where",
+    "with_for_update",
+    "with_hint",
+    "with_parent",
+    "with_session",
+    "with_statement_hint",
+    "yield_per",
+)
+
+# Frequently used non-generative methods; their results are only wrapped when
+# they happen to be a ``Query``.
+_PASSTHROUGH_QUERY_METHODS = (
+    "cte",
+    "delete",
+    "exists",
+    "get",
+    "label",
+    "scalar_subquery",
+    "subquery",
+    "update",
+)
+
+
+def _make_forwarder(name: str):
+    def forward(self, *args, **kwargs):
+        return CRUDQuery(self._crud, getattr(self._query, name)(*args, **kwargs))
+
+    forward.__name__ = name
+    forward.__qualname__ = f"CRUDQuery.{name}"
+    forward.__doc__ = f"Delegate to ``Query.{name}`` and wrap the result."
+    return forward
+
+
+def _make_passthrough(name: str):
+    def passthrough(self, *args, **kwargs):
+        result = getattr(self._query, name)(*args, **kwargs)
+        if isinstance(result, Query):
+            return CRUDQuery(self._crud, result)
+        return result
+
+    passthrough.__name__ = name
+    passthrough.__qualname__ = f"CRUDQuery.{name}"
+    passthrough.__doc__ = f"Delegate to ``Query.{name}``, wrapping ``Query`` results."
+    return passthrough
+
+
+for _name in _GENERATIVE_QUERY_METHODS:
+    if hasattr(Query, _name) and _name not in CRUDQuery.__dict__:
+        setattr(CRUDQuery, _name, _make_forwarder(_name))
+for _name in _PASSTHROUGH_QUERY_METHODS:
+    if hasattr(Query, _name) and _name not in CRUDQuery.__dict__:
+        setattr(CRUDQuery, _name, _make_passthrough(_name))
+del _name
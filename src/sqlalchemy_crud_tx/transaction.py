@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import suppress
 from contextvars import ContextVar
 from typing import Any, Literal, ParamSpec, TypeAlias, TypeVar, cast
 
+from sqlalchemy import event
 from sqlalchemy.exc import InvalidRequestError, SQLAlchemyError
+from sqlalchemy.orm import scoped_session
 
 from .types import SessionLike, SessionProvider
 
@@ -31,15 +34,17 @@ class _TxnState:
     Shared between the generic transaction state machine and CRUD contexts to
     track:
     - join depth (``depth``);
-    - whether there is an active transaction (``active``).
+    - whether there is an active transaction (``active``);
+    - whether any joined CRUD scope marked changes for commit (``dirty``).
     """
 
-    __slots__ = ("session", "depth", "active")
+    __slots__ = ("session", "depth", "active", "dirty")
 
     def __init__(self, session: SessionLike) -> None:
         self.session: SessionLike = session
         self.depth: int = 0  # current join depth
         self.active: bool = False  # whether there is an active transaction
+        self.dirty: bool = False  # whether a scope marked changes for commit
 
 
 _TxnMap: TypeAlias = dict[int, _TxnState]
@@ -86,10 +91,7 @@ def _get_or_create_txn_state(session: SessionLike) -> _TxnState:
 
 def get_current_error_policy() -> ErrorPolicy | None:
     """Return the current ``error_policy`` from the ContextVar, if any."""
-    try:
-        return _current_error_policy.get()
-    except LookupError:
-        return None
+    return _current_error_policy.get(None)
 
 
 def _resolve_session(session: SessionLike) -> Any:
@@ -145,6 +147,34 @@ def _has_pending_changes(session: SessionLike) -> bool:
         return False
 
 
+_FLUSHED_INFO_KEY = "sqlalchemy_crud_tx.flushed"
+
+
+def _record_flush(session: Any, flush_context: Any) -> None:
+    session.info[_FLUSHED_INFO_KEY] = True
+
+
+def _track_flushes(session: SessionLike, *, flushed: bool = False) -> None:
+    """Start recording flushes on ``session.info``, beginning at ``flushed``.
+
+    The ``after_flush`` listener is attached once per Session (a
+    ``scoped_session`` resolves to its current Session), so autoflushed
+    changes remain visible after ``Session.new`` / ``dirty`` are cleared.
+    """
+    target = session.registry() if isinstance(session, scoped_session) else session
+    info = target.info
+    if _FLUSHED_INFO_KEY not in info:
+        event.listen(target, "after_flush", _record_flush)
+    info[_FLUSHED_INFO_KEY] = flushed
+
+
+def _has_unmarked_changes(session: SessionLike) -> bool:
+    """Return True if the Session holds pending or flushed changes."""
+    return _has_pending_changes(session) or bool(
+        session.info.get(_FLUSHED_INFO_KEY)
+    )
+
+
 def _raise_existing_txn_error(
     *,
     policy: ExistingTxnPolicy,
@@ -170,6 +200,7 @@ def _activate_txn_state(session: SessionLike) -> _TxnState:
     state = _get_or_create_txn_state(session)
     state.depth = 0
     state.active = True
+    state.dirty = False
     return state
 
 
@@ -182,6 +213,24 @@ def _begin_session(session: SessionLike, state: _TxnState) -> None:
         raise
 
 
+def _commit_session(
+    session: SessionLike, logger: Callable[..., Any] | None = None
+) -> None:
+    """Commit the Session; on failure roll back, then re-raise.
+
+    The rollback must not mask the commit error, so its own failure is
+    suppressed.
+    """
+    try:
+        session.commit()
+    except Exception as exc:
+        if logger is not None:
+            logger("CRUD commit/rollback failed: %s", exc)
+        with suppress(Exception):
+            session.rollback()
+        raise
+
+
 def _reset_existing_txn(
     session: SessionLike, *, policy: ExistingTxnPolicy, origin: str | None
 ) -> None:
@@ -195,6 +244,36 @@ def _reset_existing_txn(
     session.rollback()
 
 
+def _apply_existing_txn_policy(
+    session: SessionLike, policy: ExistingTxnPolicy
+) -> tuple[bool, Any, bool]:
+    """Apply ``policy`` to an active transaction this library did not start.
+
+    Shared by ``CRUD.__enter__`` and the ``transaction`` decorator.
+
+    Returns:
+        ``(joined, nested_txn, in_txn)``: whether the scope joins the existing
+        transaction, the SAVEPOINT begun for ``"savepoint"`` (else ``None``),
+        and whether a transaction is still open afterwards (``False`` only
+        after ``"reset"``). ``"adopt_autobegin"`` yields ``(False, None, True)``.
+    """
+    origin_name = _get_txn_origin_name(session)
+    if policy == "error":
+        _raise_existing_txn_error(policy=policy, origin=origin_name)
+    if policy == "join":
+        return True, None, True
+    if policy == "savepoint":
+        return True, session.begin_nested(), True
+    if policy == "adopt_autobegin":
+        if origin_name != "AUTOBEGIN":
+            _raise_existing_txn_error(policy=policy, origin=origin_name)
+        return False, None, True
+    if policy == "reset":
+        _reset_existing_txn(session, policy=policy, origin=origin_name)
+        return False, None, False
+    raise ValueError(f"Unsupported existing_txn_policy: {policy}")
+
+
 class _TxnContext:
     """Basic building block for a transaction context manager.
 
@@ -267,7 +346,6 @@ def transaction(
             session = session_provider()
             state = _get_txn_state(session)
             in_txn = _in_transaction(session)
-            origin_name = _get_txn_origin_name(session) if in_txn else None
 
             if state is not None and state.active and not in_txn:
                 # Stale internal state; reset so policy can re-evaluate.
@@ -278,6 +356,23 @@ def transaction(
             joining_existing = bool(
                 join_existing and state is not None and state.active
             )
+            if joining_existing:
+                # Nested call (the common service-calls-service case): the
+                # outer scope owns commit/rollback, only depth is tracked here.
+                assert state is not None
+                state.depth += 1
+                try:
+                    return func(*args, **kwargs)
+                except SQLAlchemyError:
+                    if error_policy == "raise":
+                        raise
+                    return cast(R, None)
+                finally:
+                    if state.active:
+                        state.depth -= 1
+                        if state.depth <= 0:
+                            state.active = False
+
             adopted_external = False
             nested_txn = None
 
@@ -287,32 +382,10 @@ def transaction(
                 # If there is no active transaction, create state and begin one.
                 if not joining_existing:
                     if in_txn:
-                        if existing_txn_policy == "error":
-                            _raise_existing_txn_error(
-                                policy=existing_txn_policy, origin=origin_name
-                            )
-                        if existing_txn_policy == "join":
-                            joining_existing = True
-                        elif existing_txn_policy == "savepoint":
-                            joining_existing = True
-                            nested_txn = session.begin_nested()
-                        elif existing_txn_policy == "adopt_autobegin":
-                            if origin_name != "AUTOBEGIN":
-                                _raise_existing_txn_error(
-                                    policy=existing_txn_policy, origin=origin_name
-                                )
-                            adopted_external = True
-                        elif existing_txn_policy == "reset":
-                            _reset_existing_txn(
-                                session,
-                                policy=existing_txn_policy,
-                                origin=origin_name,
-                            )
-                            in_txn = False
-                        else:
-                            raise ValueError(
-                                f"Unsupported existing_txn_policy: {existing_txn_policy}"
-                            )
+                        joining_existing, nested_txn, in_txn = (
+                            _apply_existing_txn_policy(session, existing_txn_policy)
+                        )
+                        adopted_external = in_txn and not joining_existing
 
                     if joining_existing or adopted_external:
                         state = _activate_txn_state(session)
@@ -335,17 +408,13 @@ def transaction(
                 except BaseException as exc:
                     captured_exc = exc
 
+                    # Rollback failure should not mask the original exception.
                     if not joining_existing:
-                        try:
+                        with suppress(Exception):
                             session.rollback()
-                        except Exception:
-                            # Rollback failure should not mask the original exception.
-                            pass
                     if nested_txn is not None:
-                        try:
+                        with suppress(Exception):
                             nested_txn.rollback()
-                        except Exception:
-                            pass
 
                     is_db_error = isinstance(exc, SQLAlchemyError)
 
@@ -367,24 +436,14 @@ def transaction(
                             state.active = False
                             # Commit only when outermost and no exception.
                             if captured_exc is None and not joining_existing:
-                                try:
-                                    session.commit()
-                                except Exception as commit_exc:
-                                    # On commit failure, attempt rollback then re-raise.
-                                    try:
-                                        session.rollback()
-                                    except Exception:
-                                        pass
-                                    raise commit_exc
+                                _commit_session(session)
                     if nested_txn is not None and captured_exc is None:
                         try:
                             nested_txn.commit()
-                        except Exception as commit_exc:
-                            try:
+                        except Exception:
+                            with suppress(Exception):
                                 nested_txn.rollback()
-                            except Exception:
-                                pass
-                            raise commit_exc
+                            raise
             finally:
                 if token is not None:
                     _current_error_policy.reset(token)
@@ -3,8 +3,11 @@ import sys
 from typing import Generator
 
 import pytest
-from sqlalchemy import Column, Integer, String, create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine, event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 
 ROOT_DIR = pathlib.Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT_DIR / "src"
@@ -22,9 +25,30 @@ class SAUser(Base):  # type: ignore[misc]
     email = Column(String(255), unique=True, nullable=False)
 
 
+class SAAddress(Base):  # type: ignore[misc]
+    __tablename__ = "sa_address"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("sa_user.id"), nullable=False)
+    street = Column(String(255), nullable=False)
+    user = relationship(SAUser)
+
+
+def _enable_sqlite_savepoints(engine) -> None:
+    """Let SQLAlchemy, not pysqlite, emit BEGIN so SAVEPOINTs roll back correctly."""
+
+    @event.listens_for(engine, "connect")
+    def _no_driver_begin(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+
 @pytest.fixture(scope="function")
 def sa_session() -> Generator[Session, None, None]:
     engine = create_engine("sqlite:///:memory:", echo=False, future=True)
+    _enable_sqlite_savepoints(engine)
     Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
     session = SessionLocal()
@@ -87,6 +111,94 @@ def test_pure_sqlalchemy_transaction_join(sa_session: Session) -> None:
         assert "join-b@example.com" in emails
 
 
+def test_transaction_decorator_is_memoized_per_options(sa_session: Session) -> None:
+    """CRUD.transaction() should hand back the same decorator for equal options."""
+    CRUD.configure(session_provider=lambda: sa_session)
+    assert CRUD.transaction() is CRUD.transaction()
+    assert CRUD.transaction() is not CRUD.transaction(error_policy="status_only")
+    assert CRUD.transaction() is not CRUD.transaction(join_existing=False)
+
+
+def test_nested_transaction_calls_join_outer_scope(sa_session: Session) -> None:
+    """Nested @CRUD.transaction() calls should leave commit/rollback to the outer."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    @CRUD.transaction()
+    def inner(email: str) -> None:
+        with CRUD(SAUser) as crud:
+            crud.add(email=email)
+
+    @CRUD.transaction()
+    def outer(prefix: str, fail: bool) -> None:
+        inner(f"{prefix}-a@example.com")
+        inner(f"{prefix}-b@example.com")
+        if fail:
+            raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        outer("failed", True)
+    assert not sa_session.in_transaction()
+    assert sa_session.query(SAUser).filter(SAUser.email.like("failed-%")).count() == 0
+    sa_session.rollback()
+
+    outer("ok", False)
+    assert not sa_session.in_transaction()
+    assert sa_session.query(SAUser).filter_by(email="ok-b@example.com").count() == 1
+
+
+def test_savepoint_only_for_joined_scopes(sa_session: Session) -> None:
+    """Writes in a self-started scope should not emit SAVEPOINT; joined ones do."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement.split()[0].upper())
+
+    event.listen(sa_session.get_bind(), "before_cursor_execute", record)
+
+    with CRUD(SAUser) as crud:
+        crud.add(email="plain@example.com")
+    assert "SAVEPOINT" not in statements
+
+    @CRUD.transaction()
+    def create_joined() -> None:
+        with CRUD(SAUser) as crud:
+            crud.add(email="joined@example.com")
+
+    create_joined()
+    assert "SAVEPOINT" in statements
+
+
+def test_read_only_scope_ends_its_transaction(sa_session: Session) -> None:
+    """A read-only outermost scope should not leave the Session in BEGIN."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        assert crud.query().first() is None
+    assert not sa_session.in_transaction()
+
+    with CRUD(SAUser) as crud:
+        assert crud.query().count() == 0
+
+
+def test_sql_error_rolls_back_once(sa_session: Session) -> None:
+    """A handled SQL error should reach the database as a single ROLLBACK."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="status_only")
+    rollbacks: list[object] = []
+    event.listen(sa_session.get_bind(), "rollback", rollbacks.append)
+
+    try:
+        with CRUD(SAUser) as crud:
+            crud.add(email="dup@example.com")
+        with CRUD(SAUser) as crud:
+            assert crud.add(email="dup@example.com") is None
+            assert crud.status == SQLStatus.SQL_ERR
+    finally:
+        CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    assert len(rollbacks) == 1
+
+
 def test_session_view_commit_and_rollback_redirect(sa_session: Session) -> None:
     """Session view should allow advanced operations but redirect commit/rollback to CRUD."""
 
@@ -142,6 +254,71 @@ def test_existing_txn_policy_adopt_autobegin() -> None:
         engine.dispose()
 
 
+def test_read_only_scope_expires_instances_by_default() -> None:
+    """The read-only exit commit expires loaded rows under expire_on_commit=True."""
+    engine = create_engine("sqlite:///:memory:", echo=False, future=True)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=True)
+    session = SessionLocal()
+    try:
+        CRUD.configure(session_provider=lambda: session, error_policy="raise")
+
+        with CRUD(SAUser) as crud:
+            assert crud.add(email="expire-read@example.com") is not None
+
+        with CRUD(SAUser) as crud:
+            found = crud.first()
+            assert found is not None
+
+        assert not session.in_transaction()
+        assert sa_inspect(found).expired
+
+        statements: list[str] = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        assert found.email == "expire-read@example.com"
+        assert len(statements) == 1
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def test_read_only_scope_does_not_commit_unmarked_changes(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Changes added via crud.session without mark_for_commit stay uncommitted."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'unmarked.db'}")
+    Base.metadata.create_all(engine)
+    session = Session(bind=engine)
+    try:
+        CRUD.configure(session_provider=lambda: session, error_policy="raise")
+
+        with CRUD(SAUser) as crud:
+            crud.session.add(SAUser(email="unmarked@example.com"))
+            # Autoflushes the pending row before the scope exits.
+            assert crud.first() is not None
+
+        with engine.connect() as conn:
+            assert conn.execute(SAUser.__table__.select()).all() == []
+        session.rollback()
+
+        with CRUD(SAUser) as outer:
+            with CRUD(SAUser) as inner:
+                assert inner.add(email="nested-marked@example.com") is not None
+            assert outer.first() is not None
+
+        assert not session.in_transaction()
+        with engine.connect() as conn:
+            rows = conn.execute(SAUser.__table__.select()).all()
+        assert [row.email for row in rows] == ["nested-marked@example.com"]
+    finally:
+        session.close()
+        engine.dispose()
+
+
 def test_add_twice_same_crud_inserts_two_rows(sa_session: Session) -> None:
     """Repeated add() on the same CRUD object should insert new rows."""
     CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
@@ -262,3 +439,536 @@ def test_paginate_without_flask_sqlalchemy(sa_session: Session) -> None:
         assert page2_no_count.has_next is True
         assert page2_no_count.prev_num == 1
         assert page2_no_count.next_num == 3
+
+        windowed = crud.query().order_by(SAUser.id).paginate(
+            page=3, per_page=2, window_count=True
+        )
+        assert [u.email for u in windowed.items] == ["page-5@example.com"]
+        assert windowed.total == 5
+        assert windowed.pages == 3
+
+        past_end = crud.query().paginate(page=9, per_page=2, window_count=True)
+        assert past_end.items == []
+        assert past_end.total == 5
+
+    with CRUD(SAAddress) as crud:
+        for user in page1.items + page2_no_count.items[:1]:
+            crud.add(user=user, street="a")
+            crud.add(user=user, street="b")
+
+    with CRUD(SAUser) as crud:
+        distinct = (
+            crud.query()
+            .join(SAAddress, SAAddress.user_id == SAUser.id)
+            .distinct()
+            .paginate(page=1, per_page=2, window_count=True)
+        )
+        assert distinct.total == 3
+        assert distinct.pages == 2
+        assert len(distinct.items) == 2
+
+
+def test_get_by_primary_key(sa_session: Session) -> None:
+    """get() should resolve rows by primary key and return None when missing."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        user = crud.add(email="get@example.com")
+        assert user is not None
+        user_id = user.id
+
+    with CRUD(SAUser) as crud:
+        found = crud.get(user_id)
+        assert found is not None
+        assert found.email == "get@example.com"
+        assert crud.get(user_id + 1000) is None
+        assert crud.status == SQLStatus.OK
+
+
+def test_paginate_keyset_walks_pages_by_cursor(sa_session: Session) -> None:
+    """paginate_keyset() should seek past the cursor and report the next one."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        for idx in range(1, 6):
+            assert crud.add(email=f"keyset-{idx}@example.com") is not None
+
+    with CRUD(SAUser) as crud:
+        page1 = crud.query().paginate_keyset(SAUser.email, per_page=2)
+        assert [u.email for u in page1.items] == [
+            "keyset-1@example.com",
+            "keyset-2@example.com",
+        ]
+        assert page1.has_next is True
+        assert page1.next_cursor == "keyset-2@example.com"
+
+        page3 = crud.query().paginate_keyset(
+            SAUser.email, cursor="keyset-4@example.com", per_page=2
+        )
+        assert [u.email for u in page3.items] == ["keyset-5@example.com"]
+        assert page3.has_next is False
+        assert page3.next_cursor is None
+
+
+def test_bulk_insert_mappings(sa_session: Session) -> None:
+    """bulk_insert() should insert plain mappings without building instances."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        assert crud.bulk_insert([]) == 0
+        inserted = crud.bulk_insert(
+            [{"email": f"bulk-{idx}@example.com"} for idx in range(3)]
+        )
+        assert inserted == 3
+
+    rows = sa_session.query(SAUser).order_by(SAUser.id).all()
+    assert [r.email for r in rows] == [f"bulk-{idx}@example.com" for idx in range(3)]
+
+
+def test_add_many_returns_caller_instances(sa_session: Session) -> None:
+    """add_many() should persist transient instances in place, not copies."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    users = [SAUser(email=f"batch-{idx}@example.com") for idx in range(3)]
+    with CRUD(SAUser) as crud:
+        managed = crud.add_many(users)
+
+    assert managed is not None
+    assert all(m is u for m, u in zip(managed, users))
+    assert all(u.id is not None for u in users)
+    assert sa_session.query(SAUser).count() == 3
+
+
+def test_queue_insert_flushes_on_exit(sa_session: Session) -> None:
+    """queue_insert() rows should be inserted together when the scope commits."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        for idx in range(3):
+            crud.queue_insert(email=f"queued-{idx}@example.com")
+        assert crud.query().count() == 0
+
+    assert sa_session.query(SAUser).count() == 3
+    sa_session.rollback()
+
+    with CRUD(SAUser) as crud:
+        crud.queue_insert(email="dropped@example.com")
+        crud.discard()
+    assert sa_session.query(SAUser).count() == 3
+    sa_session.rollback()
+
+    with CRUD(SAUser) as crud:
+        crud.queue_insert(email="committed-0@example.com")
+        crud.queue_insert(email="committed-1@example.com")
+        crud.commit()
+        assert crud.query(SAUser.email.like("committed-%")).count() == 2
+    assert sa_session.query(SAUser).count() == 5
+    sa_session.rollback()
+
+    outside = CRUD(SAUser)
+    with pytest.raises(RuntimeError):
+        outside.queue_insert(email="lost@example.com")
+    with outside:
+        pass
+    assert sa_session.query(SAUser).count() == 5
+    sa_session.rollback()
+
+    with pytest.raises(IntegrityError):
+        with CRUD(SAUser) as crud:
+            crud.queue_insert(email="queued-0@example.com")
+    assert not sa_session.in_transaction()
+    assert sa_session.query(SAUser).count() == 5
+
+
+def test_update_many_single_statement(sa_session: Session) -> None:
+    """update_many() should update every matched row and report the rowcount."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        assert crud.bulk_insert(
+            [{"email": f"many-{idx}@example.com"} for idx in range(4)]
+        ) == 4
+
+    with CRUD(SAUser) as crud:
+        updated = crud.update_many(
+            crud.query(SAUser.email.in_(["many-0@example.com", "many-1@example.com"])),
+            email=SAUser.email + ".bak",
+        )
+        assert updated == 2
+        assert crud.update_many(crud.query(SAUser.id < 0), email="none") == 0
+
+    emails = [r.email for r in sa_session.query(SAUser).order_by(SAUser.id).all()]
+    assert emails == [
+        "many-0@example.com.bak",
+        "many-1@example.com.bak",
+        "many-2@example.com",
+        "many-3@example.com",
+    ]
+
+
+def test_bulk_update_applies_per_row_values(sa_session: Session) -> None:
+    """bulk_update() should set different values per primary key."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        users = crud.add_many(
+            [SAUser(email=f"pk-{idx}@example.com") for idx in range(3)]
+        )
+        assert users is not None
+        ids = [u.id for u in users]
+
+    with CRUD(SAUser) as crud:
+        assert crud.bulk_update([]) == 0
+        updated = crud.bulk_update(
+            [{"id": pk, "email": f"renamed-{pk}@example.com"} for pk in ids[:2]]
+        )
+        assert updated == 2
+
+    emails = [u.email for u in sa_session.query(SAUser).order_by(SAUser.id)]
+    assert emails == [
+        f"renamed-{ids[0]}@example.com",
+        f"renamed-{ids[1]}@example.com",
+        "pk-2@example.com",
+    ]
+
+
+def test_delete_all_records_reports_not_found(sa_session: Session) -> None:
+    """delete(all_records=True) should use the DELETE rowcount for NOT_FOUND."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        crud.bulk_insert([{"email": f"del-{idx}@example.com"} for idx in range(3)])
+
+    with CRUD(SAUser) as crud:
+        missing = crud.query(email="missing@example.com")
+        assert crud.delete(query=missing, all_records=True) is False
+        assert crud.status == SQLStatus.NOT_FOUND
+        assert crud.delete(all_records=True) is True
+
+    assert sa_session.query(SAUser).count() == 0
+
+
+def test_count_matches_query_count(sa_session: Session) -> None:
+    """count() should agree with Query.count() for plain and DISTINCT/LIMIT shapes."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        assert crud.query().count() == 0
+        crud.bulk_insert([{"email": f"count-{idx}@example.com"} for idx in range(5)])
+
+        assert crud.query().count() == 5
+        assert crud.query(SAUser.id > 2).order_by(SAUser.id).count() == 3
+        assert crud.query().limit(2).count() == 2
+        assert crud.query().with_entities(SAUser.email).distinct().count() == 5
+
+
+def test_is_plain_select_falls_back_without_select_internals() -> None:
+    """Unknown Select layouts must be treated as non-plain (use Query.count)."""
+    from types import SimpleNamespace
+
+    from sqlalchemy import select
+
+    from sqlalchemy_crud_tx.pagination import _is_plain_select
+
+    assert _is_plain_select(select(SAUser))
+    assert not _is_plain_select(select(SAUser).distinct())
+    assert not _is_plain_select(select(SAUser).group_by(SAUser.email))
+    assert not _is_plain_select(select(SAUser).offset(1))
+    assert not _is_plain_select(SimpleNamespace())  # type: ignore[arg-type]
+    assert not _is_plain_select(
+        SimpleNamespace(  # type: ignore[arg-type]
+            _distinct=False, _group_by_clauses=(), _having_criteria=()
+        )
+    )
+
+
+def test_query_columns_returns_rows_without_instances(sa_session: Session) -> None:
+    """columns() should keep filters/ordering and return plain Row tuples."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        crud.bulk_insert([{"email": f"col-{idx}@example.com"} for idx in range(3)])
+
+    sa_session.expunge_all()
+    with CRUD(SAUser) as crud:
+        rows = crud.query(SAUser.id > 1).order_by(SAUser.id.desc()).columns(
+            SAUser.id, SAUser.email
+        )
+        assert [tuple(r) for r in rows] == [
+            (3, "col-2@example.com"),
+            (2, "col-1@example.com"),
+        ]
+        assert len(sa_session.identity_map) == 0
+
+
+def test_first_reuses_cached_plan_for_default_filters(sa_session: Session) -> None:
+    """first()/all() with keyword defaults should reuse one plan per signature."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        crud.bulk_insert([{"email": f"plan-{idx}@example.com"} for idx in range(2)])
+
+    with CRUD(SAUser):
+        for idx in range(2):
+            with CRUD(SAUser, email=f"plan-{idx}@example.com") as crud:
+                found = crud.first()
+                assert found is not None
+                assert found.email == f"plan-{idx}@example.com"
+                assert crud.all() == [found]
+
+        with CRUD(SAUser, email="missing@example.com") as crud:
+            assert crud.first() is None
+
+    email_plans = [
+        key
+        for key in CRUD._plan_cache
+        if key[0] is SAUser and key[1] == frozenset({"email"})
+    ]
+    assert sorted(email_plans, key=lambda key: key[3]) == [
+        (SAUser, frozenset({"email"}), frozenset(), False),
+        (SAUser, frozenset({"email"}), frozenset(), True),
+    ]
+
+
+def test_first_with_relationship_default_filter(sa_session: Session) -> None:
+    """Relationship defaults should bypass the plan cache and use filter_by."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        owner = crud.add(email="rel-owner@example.com")
+        other = crud.add(email="rel-other@example.com")
+        assert owner is not None and other is not None
+    with CRUD(SAAddress) as crud:
+        crud.add(user=owner, street="owner street")
+        crud.add(user=other, street="other street")
+
+    with CRUD(SAAddress, user=owner) as crud:
+        found = crud.first()
+        assert found is not None
+        assert found.street == "owner street"
+    assert not any(key[0] is SAAddress for key in CRUD._plan_cache)
+
+
+def test_all_with_relationship_default_filter(sa_session: Session) -> None:
+    """all() should fall back to filter_by for relationship defaults too."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        owner = crud.add(email="rel-all-owner@example.com")
+        other = crud.add(email="rel-all-other@example.com")
+        assert owner is not None and other is not None
+    with CRUD(SAAddress) as crud:
+        crud.add(user=owner, street="first")
+        crud.add(user=owner, street="second")
+        crud.add(user=other, street="elsewhere")
+
+    with CRUD(SAAddress, user=owner) as crud:
+        assert sorted(a.street for a in crud.all()) == ["first", "second"]
+    assert not any(key[0] is SAAddress for key in CRUD._plan_cache)
+
+
+def test_generated_query_forwarders_keep_crud_query(sa_session: Session) -> None:
+    """Generated forwarders should be class attributes returning CRUDQuery."""
+    from sqlalchemy_crud_tx.query import CRUDQuery
+
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    assert "where" in CRUDQuery.__dict__
+    with CRUD(SAUser) as crud:
+        crud.bulk_insert([{"email": f"fwd-{idx}@example.com"} for idx in range(3)])
+        query = crud.query().where(SAUser.id > 1).yield_per(10)
+        assert isinstance(query, CRUDQuery)
+        assert sorted(u.email for u in query) == [
+            "fwd-1@example.com",
+            "fwd-2@example.com",
+        ]
+
+        # Passthrough table covers hot non-generative methods; anything else
+        # resolves through __getattr__ without touching the shared class.
+        assert "exists" in CRUDQuery.__dict__
+        assert crud.query().filter_by(email="fwd-0@example.com").exists() is not None
+        same = crud.query().with_transformation(lambda q: q)
+        assert isinstance(same, CRUDQuery)
+        assert "with_transformation" not in CRUDQuery.__dict__
+
+
+def test_get_applies_global_filters(sa_session: Session) -> None:
+    """get() must not return rows hidden by registered global filters."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        visible = crud.add(email="get-visible@example.com")
+        hidden = crud.add(email="get-hidden@example.com")
+        assert visible is not None and hidden is not None
+
+    CRUD.register_global_filters(SAUser.email != "get-hidden@example.com")
+    try:
+        with CRUD(SAUser) as crud:
+            # ``hidden`` is still in the identity map; the filter must win.
+            assert crud.get(hidden.id) is None
+            assert crud.get({"id": visible.id}) is visible
+
+            crud.config(disable_global_filter=True)
+            assert crud.get(hidden.id) is hidden
+    finally:
+        CRUD.register_global_filters()
+
+
+def test_query_reuses_prefiltered_base_within_context(sa_session: Session) -> None:
+    """query() should reuse the default-filtered Query until exit or config()."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    crud = CRUD(SAUser, email="base@example.com")
+    with crud:
+        first = crud.query().query
+        assert crud.query().query is first
+        assert crud.query() is crud.query()
+        assert crud.query(SAUser.id > 0).query is not first
+
+        crud.config(disable_global_filter=True)
+        assert crud.query().query is not first
+        crud.discard()
+
+    with crud:
+        assert crud.query().query is not first
+        crud.discard()
+
+
+def test_stream_and_iter_chunks(sa_session: Session) -> None:
+    """stream()/iter_chunks()/iter_all() should yield every row in batches."""
+    CRUD.configure(session_provider=lambda: sa_session, error_policy="raise")
+
+    with CRUD(SAUser) as crud:
+        crud.bulk_insert([{"email": f"stream-{idx}@example.com"} for idx in range(5)])
+
+        ordered = crud.query().order_by(SAUser.id)
+        assert [u.email for u in ordered.stream(batch=2)] == [
+            f"stream-{idx}@example.com" for idx in range(5)
+        ]
+        assert [len(chunk) for chunk in ordered.iter_chunks(batch=2)] == [2, 2, 1]
+        assert len(list(crud.iter_all(batch=3))) == 5
+
+
+def test_pool_status_reports_queue_pool_counters(tmp_path: pathlib.Path) -> None:
+    """pool_status() should expose QueuePool counters and None for other pools."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=3)
+    session = Session(bind=engine)
+    try:
+        CRUD.configure(session_provider=lambda: session)
+        status = CRUD.pool_status()
+        assert status is not None
+        assert status["size"] == 3
+        assert set(status) == {"size", "checkedin", "checkedout", "overflow"}
+
+        assert CRUD.prewarm_pool(2) == 2
+        status = CRUD.pool_status()
+        assert status is not None
+        assert status["checkedin"] == 2
+        assert status["checkedout"] == 0
+
+        # Clamped to pool_size instead of blocking on the exhausted pool.
+        assert CRUD.prewarm_pool(10) == 3
+        status = CRUD.pool_status()
+        assert status is not None
+        assert status["checkedin"] == 3
+        assert status["overflow"] <= 0
+    finally:
+        session.close()
+        engine.dispose()
+
+    memory_engine = create_engine("sqlite:///:memory:")
+    memory_session = Session(bind=memory_engine)
+    try:
+        CRUD.configure(session_provider=lambda: memory_session)
+        assert CRUD.pool_status() is None
+    finally:
+        memory_session.close()
+        memory_engine.dispose()
+
+
+def test_pool_status_resolves_engine_without_leaking_sessions(
+    tmp_path: pathlib.Path,
+) -> None:
+    """pool_status() should read sessionmaker binds and Connection binds."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2)
+    calls: list[Session] = []
+    SessionLocal = sessionmaker(bind=engine)
+
+    def counting_provider() -> Session:
+        session = SessionLocal()
+        calls.append(session)
+        return session
+
+    try:
+        CRUD.configure(session_provider=SessionLocal)
+        status = CRUD.pool_status()
+        assert status is not None and status["size"] == 2
+
+        CRUD.configure(session_provider=counting_provider)
+        assert CRUD.pool_status() is not None
+        assert len(calls) == 1
+        assert not calls[0].in_transaction()
+
+        with engine.connect() as conn:
+            conn_session = Session(bind=conn)
+            CRUD.configure(session_provider=lambda: conn_session)
+            status = CRUD.pool_status()
+            assert status is not None and status["checkedout"] == 1
+            assert CRUD.prewarm_pool(1) == 1
+            conn_session.close()
+    finally:
+        engine.dispose()
+
+
+def test_configure_prewarm_models_leaves_session_idle(sa_session: Session) -> None:
+    """prewarm_models should run on its own connection, not the Session."""
+    CRUD.configure(session_provider=lambda: sa_session, prewarm_models=[SAUser])
+    assert not sa_session.in_transaction()
+
+    with CRUD(SAUser) as crud:
+        crud.add(email="prewarm@example.com")
+    with CRUD(SAUser) as crud:
+        assert crud.query(email="prewarm@example.com").first() is not None
+        crud.discard()
+
+
+def test_configure_prewarm_models_closes_lookup_session(sa_session: Session) -> None:
+    """A Session created only to find the engine should be closed again."""
+    closed: list[Session] = []
+
+    def provider() -> Session:
+        session = Session(bind=sa_session.get_bind())
+        original_close = session.close
+
+        def close() -> None:
+            closed.append(session)
+            original_close()
+
+        session.close = close  # type: ignore[method-assign]
+        return session
+
+    CRUD.configure(session_provider=provider, prewarm_models=[SAUser])
+    assert len(closed) == 1
+
+
+def test_configure_prewarm_models_caches_runtime_statements(
+    sa_session: Session,
+) -> None:
+    """Prewarmed statements should be compiled-cache hits on the first read."""
+    engine = sa_session.get_bind()
+    CRUD.configure(session_provider=lambda: sa_session, prewarm_models=[SAUser])
+
+    cache_hits: list[bool] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.startswith("SELECT"):
+            cache_hits.append(context.cache_hit == CacheStats.CACHE_HIT)
+
+    event.listen(engine, "after_cursor_execute", record)
+    try:
+        with CRUD(SAUser) as crud:
+            crud.query().first()
+            crud.first()
+    finally:
+        event.remove(engine, "after_cursor_execute", record)
+    assert cache_hits == [True, True]